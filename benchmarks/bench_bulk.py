@@ -0,0 +1,46 @@
+"""Compares wrapping and revealing secrets one at a time against the parallel bulk pipeline.
+
+Run with `python -m benchmarks.bench_bulk`.
+"""
+
+import os
+import time
+
+from secret_type import Secret
+
+N = 4_000
+
+
+def timed(label: str, fn) -> list:
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<32} {N / elapsed:10.0f} values/s")
+    return result
+
+
+def main() -> None:
+    values = [f"password-{i}" for i in range(N)]
+
+    secrets = timed("secret() in a loop", lambda: [Secret.wrap(v) for v in values])
+    timed(
+        "dangerous_reveal in a loop", lambda: [s._dangerous_extract() for s in secrets]
+    )
+    del secrets
+
+    for workers in sorted({1, 2, 4, os.cpu_count() or 1}):
+        secrets = timed(
+            f"wrap_many(workers={workers})",
+            lambda: list(Secret.wrap_many(values, workers=workers, chunk_size=256)),
+        )
+        timed(
+            f"dangerous_reveal_many(workers={workers})",
+            lambda: list(
+                Secret.dangerous_reveal_many(secrets, workers=workers, chunk_size=256)
+            ),
+        )
+        del secrets
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Compares SecretFixedInt against SecretNumber, for throughput and for timing variation with magnitude.
+
+Run with `python -m benchmarks.bench_fixed`.
+"""
+
+import operator
+import statistics
+import timeit
+
+from secret_type import Secret
+from secret_type.containers import SecretU64, SecretU256
+from secret_type.containers.fixed import SecretFixedInt
+
+N = 200
+OPS = ["add", "mul", "xor"]
+
+
+def per_call(fn, number: int) -> float:
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+
+def throughput() -> None:
+    print("end-to-end (decrypt, operate, encrypt)")
+    for op in OPS:
+        fn = getattr(operator, op)
+        for label, s in [
+            ("SecretNumber", Secret.wrap(0xDEADBEEF)),
+            ("SecretU64", SecretU64(0xDEADBEEF)),
+            ("SecretU256", SecretU256(0xDEADBEEF)),
+        ]:
+            us = per_call(lambda: fn(s, 0xCAFE), N)
+            print(f"  {op:<4} {label:<14} {us:10.2f} us  {1e6 / us:10.0f} ops/s")
+
+
+def variation() -> None:
+    print("kernel time by operand magnitude (lower spread is better)")
+    small, large = 3, 2**256 - 3
+    for op in ["add", "mul"]:
+        kernel = getattr(SecretFixedInt, f"_{op}")
+        fn = getattr(operator, op)
+        a, b = SecretU256._to_limbs(small), SecretU256._to_limbs(large)
+        limbs = [per_call(lambda: kernel(x, x), N * 20) for x in (a, b)]
+        ints = [per_call(lambda: fn(x, x), N * 2000) for x in (small, large**8)]
+        for label, (lo, hi) in [("SecretU256", limbs), ("int", ints)]:
+            spread = (hi - lo) / statistics.mean((lo, hi)) * 100
+            print(
+                f"  {op:<4} {label:<14} {lo:8.3f} us / {hi:8.3f} us  spread {spread:6.1f}%"
+            )
+
+
+if __name__ == "__main__":
+    throughput()
+    variation()
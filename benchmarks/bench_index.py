@@ -0,0 +1,45 @@
+"""Compares finding a secret by a linear scan of `==` against a SecretKeyedDict lookup.
+
+Run with `python -m benchmarks.bench_index`.
+"""
+
+import time
+
+from secret_type import Secret
+from secret_type.index import SecretKeyedDict
+
+N = 200
+LOOKUPS = 10
+
+
+def timed(label: str, fn) -> None:
+    probes = [Secret.wrap(f"key-{i * N // LOOKUPS}") for i in range(LOOKUPS)]
+    start = time.perf_counter()
+    for probe in probes:
+        fn(probe)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<40} {elapsed / LOOKUPS * 1e6:10.1f} us/lookup")
+
+
+def scan(keys, probe):
+    for k in keys:
+        with (k == probe).dangerous_reveal() as equal:
+            if equal:
+                return k
+    return None
+
+
+def main() -> None:
+    keys = [Secret.wrap(f"key-{i}") for i in range(N)]
+    start = time.perf_counter()
+    table = SecretKeyedDict((k, i) for i, k in enumerate(keys))
+    print(
+        f"{'Building SecretKeyedDict':<40} {(time.perf_counter() - start) * 1e3:10.1f} ms"
+    )
+
+    timed(f"Linear scan of {N} secrets", lambda probe: scan(keys, probe))
+    timed(f"SecretKeyedDict of {N} secrets", lambda probe: table[probe])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""Compares wrapping a small set of repeated values with and without interning.
+
+Run with `python -m benchmarks.bench_intern`.
+"""
+
+import time
+import tracemalloc
+
+from secret_type import Secret, intern
+
+N = 2_000
+DISTINCT = 10
+
+
+def measured(label: str) -> None:
+    values = [f"tenant-key-{i % DISTINCT}" for i in range(N)]
+    tracemalloc.start()
+    start = time.perf_counter()
+    secrets = [Secret.wrap(v) for v in values]
+    elapsed = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    distinct = len({id(s) for s in secrets})
+    print(
+        f"{label:<24} {N / elapsed:10.0f} wraps/s {size / 1024:10.1f} KiB {distinct:6d} instances"
+    )
+    del secrets
+
+
+def main() -> None:
+    measured("Secret.wrap")
+    with intern.interning():
+        measured("Secret.wrap (interned)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Compares revealing a credential bundle held as five secrets against one SecretRecord.
+
+Run with `python -m benchmarks.bench_record`.
+"""
+
+import time
+
+from secret_type import Secret
+from secret_type.containers import SecretRecord
+
+N = 2_000
+
+
+class Credentials(SecretRecord):
+    username: str
+    password: str
+    host: str
+    port: int
+    token: str
+
+
+def timed(label: str, fn) -> None:
+    start = time.perf_counter()
+    for _ in range(N):
+        fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<40} {elapsed / N * 1e6:10.1f} us/reveal")
+
+
+def main() -> None:
+    values = ("app", "hunter2", "db.internal", 5432, "t" * 32)
+    fields = [Secret.wrap(v) for v in values]
+    record = Credentials(*values)
+
+    def reveal_fields():
+        for s in fields:
+            with s.dangerous_reveal():
+                pass
+
+    def reveal_record():
+        with record.dangerous_reveal():
+            pass
+
+    timed("Five separate secrets", reveal_fields)
+    timed("One SecretRecord", reveal_record)
+    print(
+        f"{'Ciphertext bytes (separate / record)':<40} "
+        f"{sum(len(s._sealed()[1]) for s in fields):6d} / {len(record._sealed()[1])}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""Compares minting tokens one at a time against bulk minting with Secret.tokens.
+
+Run with `python -m benchmarks.bench_tokens`.
+"""
+
+import time
+
+from secret_type import Secret
+
+N = 4_000
+
+
+def timed(label: str, fn) -> None:
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<40} {N / elapsed:10.0f} tokens/s")
+    del result
+
+
+def main() -> None:
+    timed("Secret.token() in a loop", lambda: [Secret.token(32) for _ in range(N)])
+    for alphabet in ["hex", "urlsafe", "bytes"]:
+        timed(
+            f"Secret.tokens(alphabet={alphabet!r})",
+            lambda: Secret.tokens(N, 32, alphabet=alphabet),
+        )
+        timed(
+            f"Secret.tokens(alphabet={alphabet!r}, batched)",
+            lambda: Secret.tokens(N, 32, alphabet=alphabet, batched=True),
+        )
+
+
+if __name__ == "__main__":
+    main()
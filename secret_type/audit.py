@@ -0,0 +1,261 @@
+"""This module contains hooks for auditing and rate-limiting reveals of secrets.
+
+Every call to [`dangerous_reveal`][secret_type.Secret.dangerous_reveal],
+[`dangerous_apply`][secret_type.Secret.dangerous_apply] or [`dangerous_map`][secret_type.Secret.dangerous_map]
+is a security-relevant event. Once an [`Auditor`][secret_type.audit.Auditor] is installed,
+each reveal appends an [`AuditEvent`][secret_type.audit.AuditEvent] to a ring buffer,
+which a background thread periodically flushes to a sink. The reveal itself never waits on the sink.
+
+Separately, [`Secret.limited`][secret_type.Secret.limited] caps the number of times a secret may be revealed.
+The cap is shared with every secret derived from it, so deriving a copy does not escape it.
+"""
+
+import atexit
+import logging
+import sys
+import threading
+import time
+from collections import deque
+from contextlib import nullcontext
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    ContextManager,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+from secret_type import provenance
+from secret_type.exceptions import SecretQuotaException
+
+if TYPE_CHECKING:
+    from secret_type.containers.secret import Secret
+
+logger = logging.getLogger(__name__)
+
+
+class AuditEvent(NamedTuple):
+    """A single reveal of a secret."""
+
+    kind: str
+    """How the secret was revealed: one of `reveal`, `apply` or `map`."""
+    container: str
+    """The name of the container type of the secret."""
+    labels: Tuple[str, ...]
+    """The [provenance][secret_type.provenance] labels of the secret, if it is tracked.
+
+    These are looked up when the event is flushed, so may be empty if the secret's history was reclaimed first."""
+    site: str
+    """The call site which revealed the secret, as `filename:lineno in function`."""
+    timestamp: float
+    """When the reveal started, in seconds since the epoch."""
+    duration: float
+    """How long the secret was revealed for, in seconds."""
+    thread: int
+    """The identifier of the thread which revealed the secret."""
+
+
+AuditSink = Callable[[List[AuditEvent]], None]
+"""A callable which receives batches of [`AuditEvent`][secret_type.audit.AuditEvent]s from the flusher thread."""
+
+
+class Auditor:
+    """Buffers [`AuditEvent`][secret_type.audit.AuditEvent]s, and flushes them to a sink from a background thread.
+
+    Events are appended to a bounded ring buffer. If the sink falls behind, the oldest events are overwritten,
+    and counted in [`dropped`][secret_type.audit.Auditor.dropped].
+
+    Args:
+        sink: Receives each batch of buffered events.
+        capacity: The maximum number of buffered events.
+        interval: How often to flush the buffer, in seconds.
+    """
+
+    def __init__(
+        self, sink: AuditSink, capacity: int = 4096, interval: float = 1.0
+    ) -> None:
+        self.sink = sink
+        self.interval = interval
+        self.dropped = 0
+        """The number of events overwritten before they could be flushed."""
+        self._buffer: "deque[Tuple[AuditEvent, Optional[provenance._Node]]]" = deque(
+            maxlen=capacity
+        )
+        self._stopped = threading.Event()
+        self._flush_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def record(self, event: AuditEvent) -> None:
+        """Appends an event to the buffer, without blocking."""
+        self._record(event, None)
+
+    def _record(self, event: AuditEvent, handle: Optional["provenance._Node"]) -> None:
+        # The event's labels are resolved from the provenance handle when it is flushed
+        if len(self._buffer) == self._buffer.maxlen:
+            self.dropped += 1
+        self._buffer.append((event, handle))
+
+    def flush(self) -> None:
+        """Sends all buffered events to the sink, on the calling thread."""
+        with self._flush_lock:
+            events = []
+            try:
+                while True:
+                    event, handle = self._buffer.popleft()
+                    if handle is not None:
+                        event = event._replace(labels=tuple(provenance._roots(handle)))
+                    events.append(event)
+            except IndexError:
+                pass
+            if not events:
+                return
+            try:
+                self.sink(events)
+            except Exception:
+                logger.exception("Audit sink failed to accept %d events", len(events))
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            self.flush()
+
+    def start(self) -> "Auditor":
+        """Starts the background flusher thread."""
+        if self._thread is None:
+            self._stopped.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="secret-audit", daemon=True
+            )
+            self._thread.start()
+            atexit.register(self.stop)
+        return self
+
+    def stop(self) -> None:
+        """Stops the background flusher thread, and flushes any remaining events."""
+        if self._thread is not None:
+            self._stopped.set()
+            self._thread.join()
+            self._thread = None
+            atexit.unregister(self.stop)
+        self.flush()
+
+
+auditor: Optional[Auditor] = None
+"""The currently-installed [`Auditor`][secret_type.audit.Auditor], if any."""
+
+
+def install(sink: AuditSink, capacity: int = 4096, interval: float = 1.0) -> Auditor:
+    """Starts auditing reveals of every secret, replacing any previously-installed auditor.
+
+    Args:
+        sink: Receives each batch of buffered events.
+        capacity: The maximum number of buffered events.
+        interval: How often to flush the buffer, in seconds.
+
+    Examples: Example:
+        ```python
+        audit.install(lambda events: logger.info("secrets revealed", extra={"events": events}))
+        ```
+    """
+    global auditor
+    uninstall()
+    auditor = Auditor(sink, capacity=capacity, interval=interval).start()
+    return auditor
+
+
+def uninstall() -> None:
+    """Stops auditing reveals, flushing any buffered events."""
+    global auditor
+    previous, auditor = auditor, None
+    if previous is not None:
+        previous.stop()
+
+
+def _site() -> str:
+    # The first frame outside of this library is the one doing the revealing
+    frame = sys._getframe(2)
+    while frame.f_back is not None:
+        module = frame.f_globals.get("__name__", "").split(".")[0]
+        if module not in ("secret_type", "contextlib"):
+            break
+        frame = frame.f_back
+    code = frame.f_code
+    return f"{code.co_filename}:{frame.f_lineno} in {code.co_name}"
+
+
+class _Reveal:
+    __slots__ = ("auditor", "secret", "kind", "site", "timestamp", "start")
+
+    def __init__(self, auditor: Auditor, s: "Secret", kind: str) -> None:
+        self.auditor, self.secret, self.kind, self.site = auditor, s, kind, _site()
+
+    def __enter__(self) -> None:
+        self.timestamp, self.start = time.time(), time.perf_counter()
+
+    def __exit__(self, *exc) -> None:
+        # Walking the provenance table is left to the flusher, off the revealing thread
+        self.auditor._record(
+            AuditEvent(
+                self.kind,
+                type(self.secret).__name__,
+                (),
+                self.site,
+                self.timestamp,
+                time.perf_counter() - self.start,
+                threading.get_ident(),
+            ),
+            self.secret._provenance,
+        )
+
+
+class _Quota:
+    # A reveal counter, shared by a limited secret and everything derived from it
+    __slots__ = ("left",)
+
+    def __init__(self, left: int) -> None:
+        self.left = left
+
+
+_quota_lock = threading.Lock()
+_untracked = nullcontext()
+
+
+def limit(s: "Secret", reveals: int) -> None:
+    """Allows `s`, and any secret later derived from it, to be revealed at most `reveals` more times in total.
+
+    Limits only ever accumulate: any limits `s` already has (including those inherited from its parents) still apply.
+
+    Prefer [`Secret.limited`][secret_type.Secret.limited], which calls this function.
+    """
+    s._quotas = s._quotas + (_Quota(reveals),)
+
+
+def inherit(s: "Secret", *parents: object) -> None:
+    """Makes reveals of `s` count against the limits of each of its `parents`.
+
+    This is called whenever a secret is derived. Anything that is not a secret is ignored.
+    """
+    quotas = s._quotas
+    for p in parents:
+        for q in getattr(p, "_quotas", ()):
+            if q not in quotas:
+                quotas += (q,)
+    s._quotas = quotas
+
+
+def revealing(s: "Secret", kind: str) -> ContextManager[None]:
+    """Wraps a reveal of `s`, enforcing its limits and recording an event if an auditor is installed.
+
+    Raises:
+        SecretQuotaException: If `s`, or a secret it was derived from, has exhausted its limit.
+    """
+    quotas = s._quotas
+    if quotas:
+        with _quota_lock:
+            if any(q.left <= 0 for q in quotas):
+                raise SecretQuotaException()
+            for q in quotas:
+                q.left -= 1
+    current = auditor
+    return _untracked if current is None else _Reveal(current, s, kind)
@@ -0,0 +1,182 @@
+"""This module contains an opt-in cache for the decrypted contents of long-lived secrets."""
+
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Callable, NamedTuple, Optional
+
+
+class _Entry(NamedTuple):
+    plaintext: bytearray
+    expires: float
+
+
+class SecretCache:
+    """A bounded LRU cache of decrypted secret contents, with per-entry TTLs.
+
+    Secrets opt in via [`Secret.cached`][secret_type.Secret.cached].
+    Entries are keyed by the identity of the secret, and are dropped as soon as the secret is collected.
+    Whenever an entry is evicted, expires, or is invalidated, its buffer is zeroed before being released.
+
+    Note:
+        Caching trades a bounded window of plain-text exposure for not having to decrypt on every read.
+        Only enable it for secrets which are read often enough to justify that trade.
+
+    Args:
+        max_bytes: The maximum total size of the cached plain-text, in bytes.
+        max_entries: The maximum number of secrets to cache, if any.
+        clock: The monotonic clock used to expire entries.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 1 << 20,
+        max_entries: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[int, _Entry]" = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+        self._released: "deque[int]" = deque()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        """The total size of the cached plain-text, in bytes."""
+        return self._nbytes
+
+    @staticmethod
+    def _wipe(entry: _Entry) -> None:
+        entry.plaintext[:] = bytes(len(entry.plaintext))
+
+    def _drop(self, key: int) -> None:
+        entry = self._entries.pop(key)
+        self._nbytes -= len(entry.plaintext)
+        self._wipe(entry)
+
+    def _drain(self) -> None:
+        # Drop the entries of secrets which were released while the lock was held
+        while self._released:
+            key = self._released.popleft()
+            if key in self._entries:
+                self._drop(key)
+
+    def get(self, key: int) -> Optional[bytes]:
+        """Returns a copy of the cached plain-text for `key`, or `None` if it is missing or expired.
+
+        Args:
+            key: The identity of the secret.
+        """
+        with self._lock:
+            self._drain()
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires <= self._clock():
+                self._drop(key)
+                return None
+            self._entries.move_to_end(key)
+            return bytes(entry.plaintext)
+
+    def put(self, key: int, plaintext: bytes, ttl: float) -> None:
+        """Caches the plain-text for `key` for up to `ttl` seconds.
+
+        Least-recently used entries are evicted until the cache is back within its bounds.
+        Plain-text larger than `max_bytes` is never cached.
+
+        Args:
+            key: The identity of the secret.
+            plaintext: The decrypted contents of the secret.
+            ttl: How long the entry may be served for, in seconds.
+        """
+        if ttl <= 0 or len(plaintext) > self.max_bytes:
+            return
+
+        with self._lock:
+            self._drain()
+            if key in self._entries:
+                self._drop(key)
+            self._purge()
+            self._entries[key] = _Entry(bytearray(plaintext), self._clock() + ttl)
+            self._nbytes += len(plaintext)
+            while self._nbytes > self.max_bytes or (
+                self.max_entries is not None and len(self._entries) > self.max_entries
+            ):
+                self._drop(next(iter(self._entries)))
+
+    def fetch(self, key: int, decrypt: Callable[[], bytes], ttl: float) -> bytes:
+        """Returns the cached plain-text for `key`, calling `decrypt` and caching the result on a miss.
+
+        Args:
+            key: The identity of the secret.
+            decrypt: Produces the plain-text when it is not cached.
+            ttl: How long a newly-cached entry may be served for, in seconds.
+        """
+        plaintext = self.get(key)
+        if plaintext is None:
+            plaintext = decrypt()
+            self.put(key, plaintext, ttl)
+        return plaintext
+
+    def invalidate(self, key: int) -> None:
+        """Drops and wipes the entry for `key`, if there is one.
+
+        Args:
+            key: The identity of the secret.
+        """
+        with self._lock:
+            self._drain()
+            if key in self._entries:
+                self._drop(key)
+
+    def release(self, key: int) -> None:
+        """Like [`invalidate`][secret_type.cache.SecretCache.invalidate], but safe to call from a finalizer.
+
+        A collection can finalize a secret while this thread holds the cache's lock (e.g. inside `put`),
+        so rather than waiting for the lock, the entry is queued and dropped by the next cache operation.
+
+        Args:
+            key: The identity of the secret.
+        """
+        if self._lock.acquire(blocking=False):
+            try:
+                self._drain()
+                if key in self._entries:
+                    self._drop(key)
+            finally:
+                self._lock.release()
+        else:
+            self._released.append(key)
+
+    def _purge(self) -> int:
+        now = self._clock()
+        expired = [k for k, e in self._entries.items() if e.expires <= now]
+        for key in expired:
+            self._drop(key)
+        return len(expired)
+
+    def purge(self) -> int:
+        """Drops and wipes every expired entry.
+
+        Returns:
+            The number of entries dropped.
+        """
+        with self._lock:
+            self._drain()
+            return self._purge()
+
+    def clear(self) -> None:
+        """Drops and wipes every entry."""
+        with self._lock:
+            self._released.clear()
+            for key in list(self._entries):
+                self._drop(key)
+
+
+default_cache = SecretCache()
+"""The cache used by [`Secret.cached`][secret_type.Secret.cached] when none is given."""
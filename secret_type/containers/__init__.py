@@ -5,5 +5,13 @@ from secret_type.containers.secret import (  # noqa # isort:skip
 )
 
 from secret_type.containers.bool import SecretBool as SecretBool
+from secret_type.containers.fixed import SecretFixedInt as SecretFixedInt
+from secret_type.containers.fixed import SecretI64 as SecretI64
+from secret_type.containers.fixed import SecretU64 as SecretU64
+from secret_type.containers.fixed import SecretU256 as SecretU256
 from secret_type.containers.number import SecretNumber as SecretNumber
+from secret_type.containers.padded import SecretPaddedStr as SecretPaddedStr
+from secret_type.containers.padded import SecretSlab as SecretSlab
+from secret_type.containers.record import SecretRecord as SecretRecord
 from secret_type.containers.sequence import SecretStr as SecretStr
+from secret_type.containers.sequence import SecretTokens as SecretTokens
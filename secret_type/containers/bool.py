@@ -1,6 +1,23 @@
+import operator
+import threading
+from functools import reduce
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+from secret_type import audit, provenance
 from secret_type.containers.secret import Secret
 from secret_type.exceptions import SecretBoolException
-from secret_type.typing.types import BoolLike
+from secret_type.typing.types import BoolLike, T, T2
+
+BoolOperand = Union["SecretBool", bool]
+
+_OPS = {
+    "and": lambda bits: reduce(operator.and_, bits, 1),
+    "or": lambda bits: reduce(operator.or_, bits, 0),
+    "xor": lambda bits: reduce(operator.xor, bits, 0),
+    "not": lambda bits: bits[0] ^ 1,
+}
+_ASSOCIATIVE = {"and", "or", "xor"}
+_seal_lock = threading.Lock()
 
 
 class SecretBool(Secret[BoolLike]):
@@ -9,20 +26,177 @@ class SecretBool(Secret[BoolLike]):
     This class is returned whenever a `bool` is derived from an operation on a [`Secret`][secret_type.Secret].
     It ensures that the result cannot be used for control flow,
     unless explicitly allowed by using [`dangerous_reveal`][secret_type.Secret.dangerous_reveal].
+
+    Secret bools can be combined with `&`, `|`, `^` and `~`, or reduced with [`all`][secret_type.containers.SecretBool.all]
+    and [`any`][secret_type.containers.SecretBool.any], without revealing them.
+    Combinations are lazy: the whole expression is evaluated the first time its result is needed,
+    decrypting each operand once and combining them without branching.
+
+    Examples: Example:
+        ```python
+        allowed = SecretBool.all([password == entered, ~expired, role == "admin"])
+        token = allowed.select(issue_token(), "")
+        ```
     """
 
+    # The pending operation and its operands, or None once evaluated. A single attribute,
+    # so that other threads never see an operation without its operands
+    _node: Optional[Tuple[str, Tuple[BoolOperand, ...]]] = None
+
+    @classmethod
+    def _expr(cls, op: str, *operands: BoolOperand) -> "SecretBool":
+        for o in operands:
+            if not isinstance(o, (SecretBool, bool)):
+                raise TypeError(
+                    "Cannot combine 'SecretBool' with '{}'".format(type(o).__name__)
+                )
+        flat: Tuple[BoolOperand, ...] = operands
+        if op in _ASSOCIATIVE:
+            # Splice in unevaluated operands of the same operation, so chains stay shallow
+            flat = ()
+            for o in operands:
+                node = o._node if isinstance(o, SecretBool) else None
+                flat += node[1] if node is not None and node[0] == op else (o,)
+        self = cls.__new__(cls)
+        self._node = (op, flat)
+        audit.inherit(self, *operands)
+        if provenance.enabled:
+            provenance.record(self, op, *operands)
+        return self
+
+    def _bit(self, bits: Dict[int, int]) -> int:
+        # Evaluate this expression as 0 or 1, without recursing, decrypting each distinct leaf only once
+        stack = [self]
+        while stack:
+            b = stack[-1]
+            if id(b) in bits:
+                stack.pop()
+                continue
+            node = b._node
+            if node is None:
+                bits[id(b)] = int(b._decode(Secret._decrypt(b)))
+                stack.pop()
+                continue
+            op, operands = node
+            pending = [
+                o for o in operands if isinstance(o, SecretBool) and id(o) not in bits
+            ]
+            if pending:
+                stack.extend(pending)
+                continue
+            stack.pop()
+            bits[id(b)] = _OPS[op](
+                [bits[id(o)] if isinstance(o, SecretBool) else int(o) for o in operands]
+            )
+        return bits[id(self)]
+
+    def _decrypt(self) -> bytes:
+        if self._node is not None:
+            # Evaluate without holding the lock; only swapping in the result is serialized
+            plaintext = self._encode(bool(self._bit({})))
+            with _seal_lock:
+                if self._node is not None:
+                    self._seal(plaintext)
+                    self._node = None
+        return super()._decrypt()
+
+    @classmethod
+    def all(cls, values: Iterable[BoolOperand]) -> "SecretBool":
+        """Returns a secret which is true if every value is true, like the builtin `all`.
+
+        Args:
+            values: Any mix of [`SecretBool`][secret_type.containers.SecretBool]s and `bool`s.
+        """
+        return cls._expr("and", *values)
+
+    @classmethod
+    def any(cls, values: Iterable[BoolOperand]) -> "SecretBool":
+        """Returns a secret which is true if any value is true, like the builtin `any`.
+
+        Args:
+            values: Any mix of [`SecretBool`][secret_type.containers.SecretBool]s and `bool`s.
+        """
+        return cls._expr("or", *values)
+
+    def select(
+        self,
+        if_true: Union[Secret[T], T],
+        if_false: Union[Secret[T2], T2],
+    ) -> Secret[Union[T, T2]]:
+        """Chooses between two values based on this secret, without branching on it.
+
+        Both values are always read, and are combined with masks derived from this bool.
+        Strings and bytes of different lengths are padded to the longer length,
+        and integers are selected arithmetically. Other types fall back to indexing a pair.
+
+        Args:
+            if_true: The value to return if this secret is true.
+            if_false: The value to return if this secret is false.
+
+        Returns:
+            The chosen value, wrapped in a new [`Secret`][secret_type.Secret].
+
+        Raises:
+            TypeError: If one value is a `str` and the other is `bytes`.
+        """
+        bit = self._bit({})
+        a, b = Secret.unwrap(if_true), Secret.unwrap(if_false)
+        return self._derive(_select(bit, a, b), "select", if_true, if_false)
+
     def flip(self):
         """Flip the value of the contained bool without revealing it."""
-        return SecretBool(not self._dangerous_extract())
+        return self._expr("not", self)
+
+    def __and__(self, other: BoolOperand) -> "SecretBool":
+        return self._expr("and", self, other)
+
+    def __or__(self, other: BoolOperand) -> "SecretBool":
+        return self._expr("or", self, other)
+
+    def __xor__(self, other: BoolOperand) -> "SecretBool":
+        return self._expr("xor", self, other)
+
+    def __invert__(self) -> "SecretBool":
+        return self._expr("not", self)
+
+    __rand__ = __and__
+    __ror__ = __or__
+    __rxor__ = __xor__
 
     def __bool__(self):
         raise SecretBoolException()
 
     def __eq__(self, other):
-        return self.dangerous_map(lambda x: x == other)
+        return self._derive(self._dangerous_map(lambda x: x == other), "eq", other)
+
+    __hash__ = Secret.__hash__
 
     def __repr__(self):
         return repr(self._dangerous_extract())
 
     def __str__(self):
         return str(self._dangerous_extract())
+
+
+def _select_int(bit: int, a: int, b: int) -> int:
+    mask = -bit
+    return (a & mask) | (b & ~mask)
+
+
+def _select(bit: int, a, b):
+    if isinstance(a, bool) and isinstance(b, bool):
+        return bool(_select_int(bit, a, b))
+    elif isinstance(a, int) and isinstance(b, int):
+        return _select_int(bit, a, b)
+    elif isinstance(a, (str, bytes)) and isinstance(b, (str, bytes)):
+        if type(a) is not type(b):
+            raise TypeError("Cannot select between 'str' and 'bytes'")
+        ab, bb = (a.encode(), b.encode()) if isinstance(a, str) else (a, b)
+        size = max(len(ab), len(bb))
+        value = _select_int(
+            bit, int.from_bytes(ab, "little"), int.from_bytes(bb, "little")
+        )
+        out = value.to_bytes(size, "little")[: _select_int(bit, len(ab), len(bb))]
+        return out.decode() if isinstance(a, str) else out
+    else:
+        return (b, a)[bit]
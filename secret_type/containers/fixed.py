@@ -0,0 +1,320 @@
+import sys
+from array import array
+from typing import ClassVar, Union
+
+from secret_type.containers.bool import SecretBool
+from secret_type.containers.secret import Secret
+
+_TYPECODE = next(c for c in "IL" if array(c).itemsize == 4)
+_LIMB_BITS = 32
+_LIMB_MASK = (1 << _LIMB_BITS) - 1
+# Keeps every intermediate a multi-digit int, so CPython never takes its small-int fast paths.
+# It sits above any carry, and is masked off of every result.
+_BIAS = 1 << 80
+_CARRY_MASK = (1 << (80 - _LIMB_BITS)) - 1
+
+
+def _wipe(*limbs: "array[int]") -> None:
+    for a in limbs:
+        for i in range(len(a)):
+            a[i] = 0
+
+
+class SecretFixedInt(Secret[int]):
+    """A specialized subclass of [`Secret[int]`][secret_type.Secret] for holding fixed-width integers.
+
+    Python's `int` is arbitrary-precision, so the time taken by arithmetic on [`SecretNumber`][secret_type.containers.SecretNumber]
+    depends on the magnitude of the value. This class instead stores its value as a fixed number of 32-bit limbs,
+    and implements addition, subtraction, multiplication, comparisons, bitwise operations and shifts
+    with a fixed sequence of operations over every limb, regardless of the value.
+    Results wrap around on overflow, as in C.
+
+    Every value of a given width also encrypts to the same size, so the ciphertext does not leak magnitude.
+
+    Note:
+        The interpreter still performs the per-limb arithmetic, so this reduces, but cannot eliminate,
+        timing variation. Shift amounts are treated as public, and division is not supported.
+
+    Args:
+        value: The initial value, which must fit in [`BITS`][secret_type.containers.SecretFixedInt.BITS] bits.
+
+    Raises:
+        OverflowError: If the initial value is out of range.
+        TypeError: If an operand is a secret of another type (including a fixed-width integer of another width
+            or signedness), since the result would not be well-defined fixed-width arithmetic.
+
+    Use one of the concrete subclasses: [`SecretU64`][secret_type.containers.SecretU64],
+    [`SecretI64`][secret_type.containers.SecretI64] or [`SecretU256`][secret_type.containers.SecretU256].
+
+    Examples: Example:
+        ```python
+        counter = SecretU64(2**64 - 1) + 1
+        with counter.dangerous_reveal() as value:
+            assert value == 0
+        ```
+    """
+
+    BITS: ClassVar[int] = 64
+    """The width of the integer, in bits."""
+    SIGNED: ClassVar[bool] = False
+    """Whether the integer is interpreted as two's complement."""
+
+    def __init__(self, value: int):
+        lo, hi = (
+            (-(1 << (self.BITS - 1)), 1 << (self.BITS - 1))
+            if self.SIGNED
+            else (0, 1 << self.BITS)
+        )
+        if not lo <= value < hi:
+            raise OverflowError(
+                "{} is out of range for '{}'".format(value, type(self).__name__)
+            )
+        super().__init__(value)
+
+    @classmethod
+    def _encode(cls, value: int) -> bytes:
+        return (value & ((1 << cls.BITS) - 1)).to_bytes(cls.BITS // 8, "little")
+
+    @classmethod
+    def _decode(cls, plaintext: bytes) -> int:
+        value = int.from_bytes(plaintext, "little")
+        if cls.SIGNED:
+            value -= (value >> (cls.BITS - 1)) << cls.BITS
+        return value
+
+    @classmethod
+    def _from_limbs(cls, limbs: "array[int]") -> "SecretFixedInt":
+        if sys.byteorder == "big":
+            limbs.byteswap()
+        self = cls.__new__(cls)
+        self._seal(limbs.tobytes())
+        _wipe(limbs)
+        return self
+
+    @classmethod
+    def _to_limbs(cls, value: Union[int, "SecretFixedInt"]) -> "array[int]":
+        # Plain ints wrap around, like the results of arithmetic
+        if isinstance(value, SecretFixedInt):
+            if type(value).BITS != cls.BITS or type(value).SIGNED != cls.SIGNED:
+                raise TypeError(
+                    "Cannot combine '{}' with '{}'".format(
+                        cls.__name__, type(value).__name__
+                    )
+                )
+            return value._limbs()
+        elif isinstance(value, int) and not isinstance(value, bool):
+            limbs = array(_TYPECODE, cls._encode(value))
+            if sys.byteorder == "big":
+                limbs.byteswap()
+            return limbs
+        raise TypeError(
+            "Cannot combine '{}' with '{}'".format(cls.__name__, type(value).__name__)
+        )
+
+    def _limbs(self) -> "array[int]":
+        limbs = array(_TYPECODE, self._decrypt())
+        if sys.byteorder == "big":
+            limbs.byteswap()
+        return limbs
+
+    def _result(
+        self, limbs: "array[int]", op: str, other: object = None
+    ) -> "SecretFixedInt":
+        return self._derive(self._from_limbs(limbs), op, other)
+
+    def _check(self, other) -> None:
+        # Other secrets would otherwise fall back to their own, variable-time operations
+        if isinstance(other, Secret) and not isinstance(other, SecretFixedInt):
+            raise TypeError(
+                "Cannot combine '{}' with '{}'; convert it to '{}' first".format(
+                    type(self).__name__, type(other).__name__, type(self).__name__
+                )
+            )
+
+    def _binary(self, other, op: str, fn) -> "SecretFixedInt":
+        self._check(other)
+        try:
+            b = self._to_limbs(other)
+        except TypeError:
+            return NotImplemented
+        a = self._limbs()
+        r = fn(a, b)
+        _wipe(a, b)
+        return self._result(r, op, other)
+
+    @staticmethod
+    def _add(a: "array[int]", b: "array[int]") -> "array[int]":
+        r, carry = array(_TYPECODE, bytes(len(a) * 4)), _BIAS
+        for i in range(len(a)):
+            t = a[i] + b[i] + carry
+            r[i] = t & _LIMB_MASK
+            carry = ((t >> _LIMB_BITS) & 1) | _BIAS
+        return r
+
+    @staticmethod
+    def _sub(a: "array[int]", b: "array[int]") -> "array[int]":
+        r, borrow = array(_TYPECODE, bytes(len(a) * 4)), 0
+        for i in range(len(a)):
+            t = _BIAS + a[i] - b[i] - borrow
+            r[i] = t & _LIMB_MASK
+            borrow = (t >> _LIMB_BITS) & 1
+        return r
+
+    @staticmethod
+    def _mul(a: "array[int]", b: "array[int]") -> "array[int]":
+        # Schoolbook multiplication, truncated to the width of the operands
+        n = len(a)
+        r = array(_TYPECODE, bytes(n * 4))
+        for i in range(n):
+            carry, x = _BIAS, a[i] | _BIAS
+            for j in range(n - i):
+                t = r[i + j] + x * b[j] + carry
+                r[i + j] = t & _LIMB_MASK
+                carry = ((t >> _LIMB_BITS) & _CARRY_MASK) | _BIAS
+        return r
+
+    def _borrow(self, a: "array[int]", b: "array[int]") -> int:
+        # 1 if a < b, else 0
+        if self.SIGNED:
+            # Flipping the sign bits maps two's complement onto unsigned order
+            a[-1] ^= 1 << (_LIMB_BITS - 1)
+            b[-1] ^= 1 << (_LIMB_BITS - 1)
+        borrow = 0
+        for i in range(len(a)):
+            borrow = ((_BIAS + a[i] - b[i] - borrow) >> _LIMB_BITS) & 1
+        return borrow
+
+    def _compare(self, other, op: str, fn) -> "SecretBool":
+        try:
+            b = self._to_limbs(other)
+        except TypeError:
+            return NotImplemented
+        a = self._limbs()
+        result = fn(a, b)
+        _wipe(a, b)
+        return self._derive(bool(result), op, other)
+
+    def __add__(self, other) -> "SecretFixedInt":
+        return self._binary(other, "add", self._add)
+
+    def __radd__(self, other) -> "SecretFixedInt":
+        return self._binary(other, "add", self._add)
+
+    def __sub__(self, other) -> "SecretFixedInt":
+        return self._binary(other, "sub", self._sub)
+
+    def __rsub__(self, other) -> "SecretFixedInt":
+        return self._binary(other, "sub", lambda a, b: self._sub(b, a))
+
+    def __mul__(self, other) -> "SecretFixedInt":
+        return self._binary(other, "mul", self._mul)
+
+    def __rmul__(self, other) -> "SecretFixedInt":
+        return self._binary(other, "mul", self._mul)
+
+    def __and__(self, other) -> "SecretFixedInt":
+        return self._binary(
+            other, "and", lambda a, b: array(_TYPECODE, (x & y for x, y in zip(a, b)))
+        )
+
+    def __or__(self, other) -> "SecretFixedInt":
+        return self._binary(
+            other, "or", lambda a, b: array(_TYPECODE, (x | y for x, y in zip(a, b)))
+        )
+
+    def __xor__(self, other) -> "SecretFixedInt":
+        return self._binary(
+            other, "xor", lambda a, b: array(_TYPECODE, (x ^ y for x, y in zip(a, b)))
+        )
+
+    __rand__ = __and__
+    __ror__ = __or__
+    __rxor__ = __xor__
+
+    def __invert__(self) -> "SecretFixedInt":
+        a = self._limbs()
+        r = array(_TYPECODE, (x ^ _LIMB_MASK for x in a))
+        _wipe(a)
+        return self._result(r, "invert")
+
+    def __neg__(self) -> "SecretFixedInt":
+        return self._binary(0, "neg", lambda a, b: self._sub(b, a))
+
+    def __pos__(self) -> "SecretFixedInt":
+        return self
+
+    def __lshift__(self, n: int) -> "SecretFixedInt":
+        # The shift amount is public, so only the limbs are handled without branching
+        if n < 0:
+            raise ValueError("negative shift count")
+        a = self._limbs()
+        q, s = divmod(n, _LIMB_BITS) if n < self.BITS else (len(a), 0)
+        r = array(_TYPECODE, bytes(len(a) * 4))
+        for i in range(q, len(a)):
+            lo = a[i - q - 1] >> (_LIMB_BITS - s) if s and i > q else 0
+            r[i] = ((a[i - q] << s) & _LIMB_MASK) | lo
+        _wipe(a)
+        return self._result(r, "lshift", n)
+
+    def __rshift__(self, n: int) -> "SecretFixedInt":
+        # Arithmetic for signed integers, logical for unsigned ones
+        if n < 0:
+            raise ValueError("negative shift count")
+        a = self._limbs()
+        fill = _LIMB_MASK * ((a[-1] >> (_LIMB_BITS - 1)) & 1) if self.SIGNED else 0
+        q, s = divmod(n, _LIMB_BITS) if n < self.BITS else (len(a), 0)
+        r = array(_TYPECODE, [fill] * len(a))
+        for i in range(len(a) - q):
+            hi = a[i + q + 1] if i + q + 1 < len(a) else fill
+            r[i] = ((a[i + q] >> s) | (hi << (_LIMB_BITS - s))) & _LIMB_MASK
+        _wipe(a)
+        return self._result(r, "rshift", n)
+
+    def __eq__(self, other) -> "SecretBool":
+        def eq(a, b):
+            acc = 0
+            for x, y in zip(a, b):
+                acc |= x ^ y
+            return ((acc - 1) >> _LIMB_BITS) & 1
+
+        result = self._compare(other, "eq", eq)
+        return self._derive(False, "eq", other) if result is NotImplemented else result
+
+    __hash__ = Secret.__hash__
+
+    def __lt__(self, other) -> "SecretBool":
+        self._check(other)
+        return self._compare(other, "lt", self._borrow)
+
+    def __gt__(self, other) -> "SecretBool":
+        self._check(other)
+        return self._compare(other, "gt", lambda a, b: self._borrow(b, a))
+
+    def __le__(self, other) -> "SecretBool":
+        self._check(other)
+        return self._compare(other, "le", lambda a, b: 1 ^ self._borrow(b, a))
+
+    def __ge__(self, other) -> "SecretBool":
+        self._check(other)
+        return self._compare(other, "ge", lambda a, b: 1 ^ self._borrow(a, b))
+
+
+class SecretU64(SecretFixedInt):
+    """An unsigned 64-bit [`SecretFixedInt`][secret_type.containers.SecretFixedInt]."""
+
+    BITS = 64
+    SIGNED = False
+
+
+class SecretI64(SecretFixedInt):
+    """A signed (two's complement) 64-bit [`SecretFixedInt`][secret_type.containers.SecretFixedInt]."""
+
+    BITS = 64
+    SIGNED = True
+
+
+class SecretU256(SecretFixedInt):
+    """An unsigned 256-bit [`SecretFixedInt`][secret_type.containers.SecretFixedInt], for cryptographic use."""
+
+    BITS = 256
+    SIGNED = False
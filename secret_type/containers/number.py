@@ -12,13 +12,21 @@ class SecretNumberMeta(ABCMeta):
     @classmethod
     def _make_wrapper(mcls, cls, op):
         def forward(self, other, *args, **kwargs):
-            return Secret.wrap(
-                getattr(operator, op)(self._dangerous_extract(), other, *args, **kwargs)
+            return self._derive(
+                getattr(operator, op)(
+                    self._dangerous_extract(), Secret.unwrap(other), *args, **kwargs
+                ),
+                op,
+                other,
             )
 
         def backward(self, other, *args, **kwargs):
-            return Secret.wrap(
-                getattr(operator, op)(other, self._dangerous_extract(), *args, **kwargs)
+            return self._derive(
+                getattr(operator, op)(
+                    Secret.unwrap(other), self._dangerous_extract(), *args, **kwargs
+                ),
+                op,
+                other,
             )
 
         forward.__name__ = f"__{op}__"
@@ -0,0 +1,294 @@
+import base64
+import hashlib
+import hmac
+import struct
+import threading
+from typing import ClassVar, List, Optional, Sequence, Union
+
+from secret_type import provenance
+from secret_type.containers.bool import SecretBool
+from secret_type.containers.secret import Secret
+from secret_type.containers.sequence import SecretStr
+from secret_type.typing.types import S
+
+_HEADER = struct.Struct("<BI")  # is_str, true length
+_BLOCK = 16  # The AES block size; every size class is a multiple of it
+_OVERHEAD = (
+    57 + _BLOCK
+)  # Fernet's version, timestamp, IV and HMAC, plus a full block of padding
+
+
+class SecretPaddedStr(SecretStr[S]):
+    """A specialized subclass of [`SecretStr`][secret_type.containers.SecretStr] which hides the length of its contents.
+
+    Contents are padded up to a size class before being encrypted, with the true length stored (encrypted) alongside them.
+    The ciphertext therefore only reveals the size class, and comparisons, digests and concatenation
+    operate over the whole padded buffer, so their timing depends on the size class rather than the true length.
+
+    By default, size classes are powers of two (of at least [`MIN_SIZE`][secret_type.containers.SecretPaddedStr.MIN_SIZE] bytes).
+    Subclasses may set [`SIZE_CLASSES`][secret_type.containers.SecretPaddedStr.SIZE_CLASSES] to use a fixed set instead.
+
+    Since every secret in a size class encrypts to the same number of bytes,
+    they can be packed into a preallocated [`SecretSlab`][secret_type.containers.SecretSlab].
+
+    Strings and bytes derived from a padded secret (for example with `upper()`, slicing or `cast`)
+    are padded in turn, in at least the same size class.
+
+    Args:
+        value: The string or bytes to protect.
+        size: The size class to use, overriding the default choice. This must be a multiple of 16 bytes.
+
+    Raises:
+        ValueError: If the value does not fit in any size class, or the size is not a multiple of 16 bytes.
+
+    Examples: Example:
+        ```python
+        token = SecretPaddedStr(request.headers["Authorization"])
+        assert token.size == 64
+        ```
+    """
+
+    MIN_SIZE: ClassVar[int] = 32
+    """The smallest power-of-two size class, in bytes."""
+    SIZE_CLASSES: ClassVar[Optional[Sequence[int]]] = None
+    """An ascending sequence of size classes, in bytes (each a multiple of 16), or `None` to use powers of two."""
+
+    def __init__(self, value: S, size: Optional[int] = None):
+        self._seal(self._pad(value, size))
+
+    @classmethod
+    def size_class(cls, length: int) -> int:
+        """Returns the size class used for contents of `length` bytes.
+
+        Raises:
+            ValueError: If no size class is large enough.
+        """
+        needed = length + _HEADER.size
+        if cls.SIZE_CLASSES is None:
+            return max(cls.MIN_SIZE, 1 << (needed - 1).bit_length())
+        for size in cls.SIZE_CLASSES:
+            if size >= needed:
+                return size
+        raise ValueError("{} bytes do not fit in any size class".format(length))
+
+    @classmethod
+    def _pad(cls, value: S, size: Optional[int] = None) -> bytes:
+        data = value.encode() if isinstance(value, str) else bytes(value)
+        size = cls.size_class(len(data)) if size is None else size
+        if size % _BLOCK:
+            raise ValueError(
+                "Size classes must be a multiple of {} bytes, not {}".format(
+                    _BLOCK, size
+                )
+            )
+        if len(data) + _HEADER.size > size:
+            raise ValueError(
+                "{} bytes do not fit in size class {}".format(len(data), size)
+            )
+        header = _HEADER.pack(isinstance(value, str), len(data))
+        return header + data + bytes(size - len(data) - _HEADER.size)
+
+    @classmethod
+    def _encode(cls, value: S) -> bytes:
+        return cls._pad(value)
+
+    @staticmethod
+    def _decode(plaintext: bytes) -> S:
+        is_str, length = _HEADER.unpack_from(plaintext)
+        data = plaintext[_HEADER.size : _HEADER.size + length]
+        return data.decode() if is_str else data
+
+    @property
+    def size(self) -> int:
+        """The size class of this secret, in bytes. This is public, as the ciphertext reveals it."""
+        return len(base64.urlsafe_b64decode(self._sealed()[1])) - _OVERHEAD
+
+    @classmethod
+    def _shape(cls, value: Union[Secret, S]) -> int:
+        # Interned secrets must share a size class, or interning would undo the caller's choice of one
+        if isinstance(value, SecretPaddedStr):
+            return value.size
+        data = value.encode() if isinstance(value, str) else bytes(value)
+        return cls.size_class(len(data))
+
+    def _derive(self, value, op: str, *others):
+        # Strings and bytes derived from this secret stay padded, in at least the same size class
+        if isinstance(value, (str, bytes)):
+            data = value.encode() if isinstance(value, str) else value
+            size = max(self.size, self.size_class(len(data)))
+            value = type(self)(value, size=size)
+        return super()._derive(value, op, *others)
+
+    @staticmethod
+    def _padded(other: Union[Secret, str, bytes]) -> bytes:
+        if isinstance(other, SecretPaddedStr):
+            return other._decrypt()
+        value = Secret.unwrap(other)
+        if not isinstance(value, (str, bytes)):
+            raise TypeError(
+                "Cannot combine 'SecretPaddedStr' with '{}'".format(
+                    type(value).__name__
+                )
+            )
+        return SecretPaddedStr._pad(value)
+
+    def __eq__(self, o: Union[Secret, str, bytes]) -> SecretBool:
+        a = self._decrypt()
+        try:
+            b = self._padded(o)
+        except TypeError:
+            # If the types don't match, we want to always return False
+            hmac.compare_digest(a, a)
+            return self._derive(False, "eq", o)
+        size = max(len(a), len(b))
+        equal = hmac.compare_digest(a.ljust(size, b"\0"), b.ljust(size, b"\0"))
+        return self._derive(equal, "eq", o)
+
+    __hash__ = Secret.__hash__
+
+    def digest(self, name: str = "sha256") -> SecretStr[bytes]:
+        """Hashes the whole padded representation of this secret.
+
+        Equal values in the same size class always have equal digests.
+
+        Args:
+            name: The name of a [`hashlib`][hashlib] algorithm.
+
+        Returns:
+            The digest, as a new secret.
+        """
+        return self._derive(hashlib.new(name, self._decrypt()).digest(), "digest")
+
+    def _concat(self, a: bytes, b: bytes) -> "SecretPaddedStr":
+        # Both operands are read in full, and the result's size class depends only on theirs
+        (a_str, a_len), (b_str, b_len) = _HEADER.unpack_from(a), _HEADER.unpack_from(b)
+        if a_str != b_str:
+            raise TypeError("Cannot concatenate 'str' and 'bytes'")
+        data = a[_HEADER.size :][:a_len] + b[_HEADER.size :][:b_len]
+        size = self.size_class(len(a) + len(b) - 2 * _HEADER.size)
+        result = type(self).__new__(type(self))
+        result._seal(
+            _HEADER.pack(a_str, a_len + b_len)
+            + data
+            + bytes(size - _HEADER.size - len(data))
+        )
+        return result
+
+    def __add__(self, other: Union[Secret, str, bytes]) -> "SecretPaddedStr":
+        return self._derive(
+            self._concat(self._decrypt(), self._padded(other)), "add", other
+        )
+
+    def __radd__(self, other: Union[Secret, str, bytes]) -> "SecretPaddedStr":
+        return self._derive(
+            self._concat(self._padded(other), self._decrypt()), "radd", other
+        )
+
+
+class SecretSlab:
+    """A preallocated, fixed-size store for [`SecretPaddedStr`][secret_type.containers.SecretPaddedStr]s of one size class.
+
+    Every secret in a size class has the same encrypted size, so the slab reserves all of its memory up front,
+    and each slot holds one secret's key and ciphertext. Secrets are never decrypted by the slab.
+
+    Args:
+        size: The size class of the secrets to store.
+        capacity: The number of slots.
+        cls: The type of secrets to store.
+
+    Examples: Example:
+        ```python
+        slab = SecretSlab(size=64, capacity=10_000)
+        slot = slab.store(SecretPaddedStr(token, size=64))
+        token = slab.load(slot)
+        ```
+    """
+
+    _KEY_SIZE = 44  # A urlsafe base64-encoded Fernet key
+
+    def __init__(self, size: int, capacity: int, cls: type = SecretPaddedStr) -> None:
+        self.size = size
+        self.capacity = capacity
+        self.cls = cls
+        probe = cls("", size=size)
+        self._token_size = len(probe._sealed()[1])
+        self._slot_size = self._KEY_SIZE + self._token_size
+        self._buffer = bytearray(capacity * self._slot_size)
+        self._free: List[int] = list(range(capacity - 1, -1, -1))
+        self._used = bytearray(capacity)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self.capacity - len(self._free)
+
+    @property
+    def nbytes(self) -> int:
+        """The total size of the slab, in bytes."""
+        return len(self._buffer)
+
+    def store(self, s: SecretPaddedStr) -> int:
+        """Copies a secret into a free slot.
+
+        Returns:
+            The slot the secret was stored in.
+
+        Raises:
+            ValueError: If the secret is not of this slab's type and size class,
+                or has a [reveal limit][secret_type.Secret.limited] or [provenance][secret_type.provenance],
+                which cannot be carried over to the loaded copy.
+            IndexError: If the slab is full.
+        """
+        if s._quotas or provenance._node(s) >= 0:
+            raise ValueError("Cannot store a secret with a reveal limit or provenance")
+        if not isinstance(s, self.cls) or s.size != self.size:
+            raise ValueError(
+                "Secret is not a {} of size class {}".format(
+                    self.cls.__name__, self.size
+                )
+            )
+        key, token = s._sealed()
+        with self._lock:
+            if not self._free:
+                raise IndexError("SecretSlab is full")
+            slot = self._free.pop()
+            self._used[slot] = 1
+            offset = slot * self._slot_size
+            self._buffer[offset : offset + self._slot_size] = key + token
+        return slot
+
+    def _check(self, slot: int) -> None:
+        if not 0 <= slot < self.capacity:
+            raise IndexError("Slot {} is out of range".format(slot))
+        if not self._used[slot]:
+            raise ValueError("Slot {} is empty".format(slot))
+
+    def load(self, slot: int) -> SecretPaddedStr:
+        """Returns the secret stored in `slot`.
+
+        Raises:
+            IndexError: If the slot is out of range.
+            ValueError: If the slot is empty.
+        """
+        offset = slot * self._slot_size
+        # Copy the slot out under the lock, so it cannot be freed and zeroed halfway through
+        with self._lock:
+            self._check(slot)
+            key = bytes(self._buffer[offset : offset + self._KEY_SIZE])
+            token = bytes(
+                self._buffer[offset + self._KEY_SIZE : offset + self._slot_size]
+            )
+        return self.cls._from_sealed(key, token)
+
+    def free(self, slot: int) -> None:
+        """Zeroes `slot`, and makes it available for reuse.
+
+        Raises:
+            IndexError: If the slot is out of range.
+            ValueError: If the slot is already free.
+        """
+        with self._lock:
+            self._check(slot)
+            self._used[slot] = 0
+            offset = slot * self._slot_size
+            self._buffer[offset : offset + self._slot_size] = bytes(self._slot_size)
+            self._free.append(slot)
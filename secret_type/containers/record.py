@@ -0,0 +1,243 @@
+import dataclasses
+import hmac
+import pickle
+from collections import namedtuple
+from typing import Any, Callable, ClassVar, Dict, Tuple, Type, Union
+
+from secret_type import audit
+from secret_type.containers.bool import SecretBool
+from secret_type.containers.secret import Secret
+from secret_type.index import _canonical
+from secret_type.typing.types import T2
+
+
+def _is_classvar(t: Any) -> bool:
+    if isinstance(t, str):
+        return t.startswith(("ClassVar", "typing.ClassVar"))
+    return t is ClassVar or getattr(t, "__origin__", None) is ClassVar
+
+
+class SecretRecord(Secret[Tuple[Any, ...]]):
+    """A specialized subclass of [`Secret`][secret_type.Secret] for holding a group of related fields.
+
+    All of the fields are encoded together and encrypted once, so a record costs one key, one ciphertext
+    and one decryption, rather than one per field. Revealing a record yields a `namedtuple` of its fields,
+    and individual fields can be accessed (or replaced) without revealing the rest.
+
+    Fields are declared with annotations on a subclass, with optional defaults, as with a dataclass.
+    Alternatively, [`of`][secret_type.containers.SecretRecord.of] declares a record with the fields
+    of an existing dataclass or `TypedDict`.
+
+    To [intern][secret_type.intern] a record, pass [`intern`][secret_type.Secret.intern] a tuple of its fields.
+    Record types must be [registered][secret_type.serialization.register] before they can be serialized,
+    as their fields are not stored.
+
+    Examples: Example:
+        ```python
+        class DatabaseCredentials(SecretRecord):
+            username: str
+            password: str
+            host: str
+            port: int = 5432
+
+        creds = DatabaseCredentials(username="app", password=password, host="db.internal")
+        with creds.dangerous_reveal() as c:
+            connect(user=c.username, password=c.password, host=c.host, port=c.port)
+        ```
+    """
+
+    FIELDS: ClassVar[Tuple[str, ...]] = ()
+    """The names of the fields, in order."""
+    TUPLE: ClassVar[Type[Tuple[Any, ...]]] = namedtuple("SecretRecord", ())
+    """The `namedtuple` type which revealing a record yields."""
+
+    _annotations: ClassVar[Dict[str, Any]] = {}
+    _defaults: ClassVar[Dict[str, Any]] = {}
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        annotations, defaults = dict(cls._annotations), dict(cls._defaults)
+        for name, t in cls.__dict__.get("__annotations__", {}).items():
+            if name.startswith("_") or _is_classvar(t):
+                continue
+            annotations[name] = t
+            if name in cls.__dict__:
+                # Defaults live on the namedtuple, so they can't shadow methods
+                defaults[name] = cls.__dict__[name]
+                delattr(cls, name)
+            else:
+                defaults.pop(name, None)
+
+        fields = tuple(annotations)
+        first = next((i for i, f in enumerate(fields) if f in defaults), len(fields))
+        for name in fields[first:]:
+            if name not in defaults:
+                raise TypeError(
+                    "Non-default field '{}' follows a default field".format(name)
+                )
+
+        cls._annotations, cls._defaults = annotations, defaults
+        cls.FIELDS = fields
+        cls.TUPLE = namedtuple(  # type: ignore
+            cls.__name__,
+            fields,
+            defaults=[defaults[f] for f in fields[first:]],
+            module=cls.__module__,
+        )
+        cls.TUPLE.__qualname__ = "{}.TUPLE".format(cls.__qualname__)
+
+    @classmethod
+    def of(cls, schema: type) -> Type["SecretRecord"]:
+        """Declares a record type with the same fields as a dataclass or `TypedDict`.
+
+        Dataclass defaults are kept (default factories are not).
+        A `TypedDict` has no defaults, so every key becomes a required field, including keys it marks as not required.
+
+        Args:
+            schema: The dataclass or `TypedDict` to copy fields from.
+
+        Returns:
+            A new subclass of this class.
+
+        Raises:
+            TypeError: If `schema` is neither a dataclass nor a `TypedDict`.
+
+        Examples: Example:
+            ```python
+            @dataclass
+            class Credentials:
+                username: str
+                password: str
+
+            SecretCredentials = SecretRecord.of(Credentials)
+            ```
+        """
+        namespace: Dict[str, Any] = {"__module__": schema.__module__}
+        if dataclasses.is_dataclass(schema):
+            fields = dataclasses.fields(schema)
+            namespace["__annotations__"] = {f.name: f.type for f in fields}
+            namespace.update(
+                (f.name, f.default)
+                for f in fields
+                if f.default is not dataclasses.MISSING
+            )
+        elif isinstance(schema, type) and issubclass(schema, dict):
+            namespace["__annotations__"] = dict(getattr(schema, "__annotations__", {}))
+        else:
+            raise TypeError(
+                "Cannot declare a record from '{}'".format(
+                    getattr(schema, "__name__", type(schema).__name__)
+                )
+            )
+        return type(schema.__name__, (cls,), namespace)
+
+    def __init__(self, *args, **kwargs):
+        self._seal(self._encode(self.TUPLE(*args, **kwargs)))
+
+    @classmethod
+    def _normalize(cls, value: Tuple[Any, ...]) -> Tuple[Any, ...]:
+        # Records are interned from a tuple of their fields, which may omit defaults
+        return cls.TUPLE(*value)
+
+    @classmethod
+    def _from_value(cls, value: Tuple[Any, ...]) -> "SecretRecord":
+        return cls(*value)
+
+    @classmethod
+    def _encode(cls, value: Tuple[Any, ...]) -> bytes:
+        # A plain tuple pickles more compactly than a namedtuple
+        return pickle.dumps(tuple(value))
+
+    @classmethod
+    def _decode(cls, plaintext: bytes) -> Tuple[Any, ...]:
+        return cls.TUPLE._make(pickle.loads(plaintext))  # type: ignore
+
+    @classmethod
+    def _index(cls, name: str) -> int:
+        try:
+            return cls.FIELDS.index(name)
+        except ValueError:
+            raise AttributeError(
+                "'{}' has no field '{}'".format(cls.__name__, name)
+            ) from None
+
+    def get(self, name: str) -> Secret[Any]:
+        """Returns a single field, wrapped in a new secret.
+
+        Args:
+            name: The name of the field.
+
+        Raises:
+            AttributeError: If there is no such field.
+        """
+        i = self._index(name)
+        return self._derive(self._dangerous_map(lambda r: r[i]), "get")
+
+    def dangerous_apply_field(
+        self, name: str, fn: Callable[..., Any], *args, **kwargs
+    ) -> None:
+        """Like [`dangerous_apply`][secret_type.Secret.dangerous_apply], but only reveals a single field.
+
+        Args:
+            name: The name of the field.
+            fn: The function to apply to the field's value.
+
+        Raises:
+            AttributeError: If there is no such field.
+        """
+        i = self._index(name)
+        with audit.revealing(self, "apply"):
+            self._dangerous_map(lambda r: fn(r[i], *args, **kwargs))
+
+    def dangerous_map_field(
+        self, name: str, fn: Callable[..., Union[Secret[T2], T2]], *args, **kwargs
+    ) -> Secret[T2]:
+        """Like [`dangerous_map`][secret_type.Secret.dangerous_map], but only reveals a single field.
+
+        Args:
+            name: The name of the field.
+            fn: The function to apply to the field's value.
+
+        Returns:
+            A new [`Secret`][secret_type.Secret] of the return type of `fn`.
+
+        Raises:
+            AttributeError: If there is no such field.
+        """
+        i = self._index(name)
+        with audit.revealing(self, "map"):
+            value = self._dangerous_map(lambda r: fn(r[i], *args, **kwargs))
+        return self._derive(value, "map")
+
+    def replace(self, **changes: Any) -> "SecretRecord":
+        """Returns a copy of this record with some fields replaced, decrypting and encrypting once.
+
+        Values may be secrets, in which case they are unwrapped.
+
+        Raises:
+            ValueError: If any of the fields do not exist.
+        """
+        values = {k: Secret.unwrap(v) for k, v in changes.items()}
+        result = type(self).__new__(type(self))
+        result._seal(self._encode(self._dangerous_map(lambda r: r._replace(**values))))
+        # Pass on the original values, so the result inherits the quotas and provenance of secret ones
+        return self._derive(result, "replace", *changes.values())
+
+    def __eq__(self, o: object) -> SecretBool:
+        plaintext = self._decrypt()
+        a = self._decode(plaintext)
+        if isinstance(o, SecretRecord) and o.FIELDS == self.FIELDS:
+            b = o._dangerous_extract()
+        elif isinstance(o, tuple) and len(o) == len(a):
+            b = o
+        else:
+            # If the types don't match, we want to always return False
+            hmac.compare_digest(plaintext, plaintext)
+            return self._derive(False, "eq", o)
+        # Compare every field, without stopping at the first difference
+        equal = True
+        for x, y in zip(a, b):
+            equal &= hmac.compare_digest(_canonical(x), _canonical(y))
+        return self._derive(equal, "eq", o)
+
+    __hash__ = Secret.__hash__
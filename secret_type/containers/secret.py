@@ -1,17 +1,53 @@
+import base64
 import gc
 import pickle
 import secrets
 from contextlib import contextmanager
 from functools import wraps
-from typing import Any, Callable, Generator, Generic, Optional, Type, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    overload,
+)
 
 from cryptography.fernet import Fernet
-from typing_extensions import Concatenate
+from typing_extensions import Concatenate, Literal
 
+from secret_type import audit, provenance
 from secret_type.exceptions import *
-from secret_type.monad import SecretMonad
+from secret_type.monad import SecretMonad, _pipeline
 from secret_type.typing.types import *
 
+if TYPE_CHECKING:
+    from secret_type.cache import SecretCache
+
+TokenAlphabet = Literal["hex", "urlsafe", "bytes"]
+
+# For each alphabet: the default token length (for 32 bytes of entropy),
+# the number of random bytes needed for a token of a given length, and an encoder
+_TOKEN_ALPHABETS: Dict[
+    str, Tuple[int, Callable[[int], int], Callable[[bytes], StringLike]]
+] = {
+    "hex": (64, lambda n: -(-n // 2), bytes.hex),
+    "urlsafe": (
+        43,
+        lambda n: -(-n * 3 // 4),
+        lambda b: base64.urlsafe_b64encode(b).rstrip(b"=").decode(),
+    ),
+    "bytes": (32, lambda n: n, bytes),
+}
+
 ApplyFn = Callable[Concatenate[T, P], Any]
 MapFn = Callable[Concatenate[T, P], Union["Secret[T2]", T2]]
 
@@ -23,22 +59,147 @@ class Secret(Generic[T], SecretMonad):
     but using the monad-like [`Secret.wrap`][secret_type.monad.SecretMonad.wrap] method is preferred,
     as it will use specialized subclasses that provide extra functionality."""
 
+    _cache: Optional["SecretCache"] = None
+    _cache_ttl: float = 0.0
+    _provenance: Optional["provenance._Node"] = None
+    _quotas: Tuple["audit._Quota", ...] = ()
+    _interned: bool = False
+
     @classmethod
     def token(cls, length: Optional[int] = None) -> "SecretStr":
         """Generate a cryptographically secure random token, and wrap it in a [`SecretStr`][secret_type.containers.SecretStr].
 
         Args:
-            length: The length of the token to generate.
+            length: The length of the token to generate. Defaults to 64 hex digits (32 bytes of entropy),
+                which is also used when `length` is 0.
+        """
+        return cls.tokens(1, length or None)[0]
+
+    @overload
+    @classmethod
+    def tokens(
+        cls,
+        n: int,
+        length: Optional[int] = ...,
+        alphabet: TokenAlphabet = ...,
+        batched: Literal[False] = ...,
+    ) -> List["SecretStr"]: ...
+
+    @overload
+    @classmethod
+    def tokens(
+        cls,
+        n: int,
+        length: Optional[int] = ...,
+        alphabet: TokenAlphabet = ...,
+        batched: Literal[True] = ...,
+    ) -> "SecretTokens": ...
+
+    @classmethod
+    def tokens(
+        cls,
+        n: int,
+        length: Optional[int] = None,
+        alphabet: TokenAlphabet = "hex",
+        batched: bool = False,
+    ) -> Union[List["SecretStr"], "SecretTokens"]:
+        """Generate many cryptographically secure random tokens at once.
+
+        Entropy for every token is drawn in a single read from the OS.
+
+        Args:
+            n: The number of tokens to generate.
+            length: The exact length of each token, in characters (or bytes).
+                Defaults to the length needed for 32 bytes of entropy.
+            alphabet: `hex` for hex digits, `urlsafe` for URL-safe base64, or `bytes` for raw bytes.
+            batched: Whether to return all the tokens in a single [`SecretTokens`][secret_type.containers.SecretTokens],
+                which is encrypted once, instead of one [`SecretStr`][secret_type.containers.SecretStr] per token.
+
+        Examples: Example:
+            ```python
+            session_ids = Secret.tokens(1000, 32, alphabet="urlsafe")
+            ```
+
+        Raises:
+            ValueError: If `n` is negative, `length` is less than 1, or `alphabet` is unknown.
+        """
+        if alphabet not in _TOKEN_ALPHABETS:
+            raise ValueError("Unknown token alphabet '{}'".format(alphabet))
+        if n < 0:
+            raise ValueError(
+                "Cannot generate a negative number of tokens, got {}".format(n)
+            )
+        if length is not None and length < 1:
+            raise ValueError("Token length must be at least 1, got {}".format(length))
+        default, entropy_for, encode = _TOKEN_ALPHABETS[alphabet]
+        length = default if length is None else length
+        size = entropy_for(length)
+        entropy = secrets.token_bytes(n * size)
+        values = tuple(
+            encode(entropy[i : i + size])[:length] for i in range(0, n * size, size)
+        )
+        if batched:
+            return SecretTokens(values)
+        return [SecretStr(v) for v in values]
+
+    @classmethod
+    def intern(cls, value: Union["Secret[T]", T]) -> "Secret[T]":
+        """Returns a shared secret equal to `value`, so that repeated values are only encrypted once.
+
+        See [`secret_type.intern`][secret_type.intern] for details, and for enabling this automatically.
+
+        Args:
+            value: A secret, or a primitive value to wrap.
+                Primitive values are wrapped in this class, unless it is [`Secret`][secret_type.Secret] itself,
+                in which case the type is chosen as in [`wrap`][secret_type.monad.SecretMonad.wrap].
+
+        Examples: Example:
+            ```python
+            api_key = Secret.intern(tenant.api_key)
+            assert Secret.intern(tenant.api_key) is api_key
+            ```
         """
-        return SecretStr(secrets.token_hex(length // 2 if length else None))
+        from secret_type import intern
+
+        return intern.intern(value, None if cls is Secret else cls)
+
+    @classmethod
+    def _normalize(cls, value: T) -> T:
+        # A plain value, as this container would reveal it
+        return value
+
+    @classmethod
+    def _shape(cls, value: Union["Secret[T]", T]) -> object:
+        # Public properties of a secret (or normalized plain value) which secrets sharing it must agree on
+        return None
+
+    @classmethod
+    def _from_value(cls, value: T) -> "Secret[T]":
+        # Wrap a normalized plain value in this container
+        return cls(value)
+
+    @classmethod
+    def _from_sealed(cls, key: bytes, token: bytes) -> "Secret[T]":
+        # Adopt an existing Fernet key and token, skipping encryption entirely
+        self = cls.__new__(cls)
+        self.__key = key
+        self.__value = token
+        return self
 
     def __init__(self, value: T):
-        key = self.__key = Fernet.generate_key()
-        self.__value = Fernet(key).encrypt(pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+        self._seal(self._encode(value))
 
     def __del__(self):
-        del self.__key
-        del self.__value
+        if self._cache is not None:
+            self._cache.release(id(self))
+        if self._provenance is not None:
+            provenance.release(self)
+        try:
+            del self.__key
+            del self.__value
+        except AttributeError:
+            # Nothing was ever sealed (e.g. the constructor raised)
+            return
         gc.collect()
 
     def cast(self, t: Type[T2], *args, **kwargs) -> "Secret[T2]":
@@ -55,7 +216,119 @@ class Secret(Generic[T], SecretMonad):
             ValueError: If the value cannot be cast to the new type.
         """
         # Up to the user to provide a valid cast
-        return self.dangerous_map(lambda x: t(x, *args, **kwargs))  # type: ignore
+        return self._derive(
+            self._dangerous_map(lambda x: t(x, *args, **kwargs)), "cast"
+        )  # type: ignore
+
+    def cached(
+        self, ttl: float = 60.0, cache: Optional["SecretCache"] = None
+    ) -> "Secret[T]":
+        """Opts this secret in to caching its decrypted contents.
+
+        Reads of a cached secret skip decryption for up to `ttl` seconds.
+        This is intended for long-lived secrets on hot paths (such as database passwords),
+        and trades a bounded window of plain-text exposure for a large cut in CPU.
+
+        Args:
+            ttl: How long the decrypted contents may be served for, in seconds.
+            cache: The [`SecretCache`][secret_type.cache.SecretCache] to use.
+                Defaults to [`default_cache`][secret_type.cache.default_cache].
+
+        Returns:
+            This secret, to allow chaining.
+
+        Examples: Example:
+            ```python
+            password = secret(os.environ["DB_PASSWORD"]).cached(ttl=30)
+            ```
+
+        Raises:
+            SecretInternException: If this secret is [interned][secret_type.intern].
+        """
+        from secret_type.cache import default_cache
+
+        self._check_private()
+        self.uncached()
+        self._cache = default_cache if cache is None else cache
+        self._cache_ttl = ttl
+        return self
+
+    def uncached(self) -> "Secret[T]":
+        """Opts this secret out of caching, wiping any cached contents.
+
+        Returns:
+            This secret, to allow chaining.
+
+        Raises:
+            SecretInternException: If this secret is [interned][secret_type.intern].
+        """
+        self._check_private()
+        if self._cache is not None:
+            self._cache.invalidate(id(self))
+            self._cache = None
+        return self
+
+    def labeled(self, label: str) -> "Secret[T]":
+        """Gives this secret an origin label, and tracks its provenance.
+
+        While [provenance tracking][secret_type.provenance] is enabled,
+        secrets derived from this one will record that they came from it.
+
+        Args:
+            label: A short description of where this secret came from.
+
+        Returns:
+            This secret, to allow chaining.
+
+        Examples: Example:
+            ```python
+            password = secret(os.environ["DB_PASSWORD"]).labeled("db-password")
+            ```
+
+        Raises:
+            SecretInternException: If this secret is [interned][secret_type.intern].
+        """
+        self._check_private()
+        provenance.label(self, label)
+        return self
+
+    def limited(self, reveals: int) -> "Secret[T]":
+        """Limits the number of times this secret may be revealed.
+
+        Each call to [`dangerous_reveal`][secret_type.Secret.dangerous_reveal],
+        [`dangerous_apply`][secret_type.Secret.dangerous_apply] or [`dangerous_map`][secret_type.Secret.dangerous_map]
+        counts against the quota. Operations which derive a new secret do not,
+        but the derived secret shares this quota: revealing it counts against the same limit,
+        so the value cannot be read without limit by deriving a copy (such as `s[:]` or `s.cast(bytes)`).
+
+        Calling this again adds another limit; it never loosens an existing one.
+
+        Args:
+            reveals: The number of reveals to allow from now on.
+
+        Returns:
+            This secret, to allow chaining.
+
+        Raises:
+            SecretInternException: If this secret is [interned][secret_type.intern].
+            SecretQuotaException: Raised by later reveals, once the quota is exhausted.
+        """
+        self._check_private()
+        audit.limit(self, reveals)
+        return self
+
+    def _check_private(self) -> None:
+        # Per-instance settings on a shared secret would apply to every holder of it
+        if self._interned:
+            raise SecretInternException()
+
+    def _has_private_state(self) -> bool:
+        # Whether this secret has settings which would be shared if it were interned
+        return (
+            self._cache is not None
+            or bool(self._quotas)
+            or self._provenance is not None
+        )
 
     @property
     def protected_type(self) -> type:
@@ -84,16 +357,52 @@ class Secret(Generic[T], SecretMonad):
         raise SecretKeyException()
 
     def __bool__(self) -> "SecretBool":
-        return SecretBool(bool(self._dangerous_extract()))
+        return self._derive(bool(self._dangerous_extract()), "bool")
 
     def __repr__(self) -> str:
         return f"Secret({self.protected_type}, <hidden>)"
 
-    def _dangerous_map(self, fn: Callable[[T], R], *args, **kwargs) -> R:
-        return fn(
-            pickle.loads(Fernet(self.__key).decrypt(self.__value)), *args, **kwargs
+    @staticmethod
+    def _encode(value: T) -> bytes:
+        return pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def _decode(plaintext: bytes) -> T:
+        return pickle.loads(plaintext)
+
+    def _seal(self, plaintext: bytes) -> None:
+        key = self.__key = Fernet.generate_key()
+        self.__value = Fernet(key).encrypt(plaintext)
+
+    def _sealed(self) -> Tuple[bytes, bytes]:
+        # The Fernet key and token, as accepted by _from_sealed
+        return self.__key, self.__value
+
+    def _decrypt(self) -> bytes:
+        if self._cache is None:
+            return Fernet(self.__key).decrypt(self.__value)
+        return self._cache.fetch(
+            id(self), lambda: Fernet(self.__key).decrypt(self.__value), self._cache_ttl
         )
 
+    def _dangerous_map(self, fn: Callable[[T], R], *args, **kwargs) -> R:
+        return fn(self._decode(self._decrypt()), *args, **kwargs)
+
+    def _derive(self, value: Union["Secret[T2]", T2], op: str, *others) -> "Secret[T2]":
+        # Wrap a value derived from this secret, recording its provenance.
+        # Results which inherit quotas or provenance are never interned, as that would share them
+        if isinstance(value, Secret) or not any(
+            isinstance(p, Secret) and p._has_private_state() for p in (self, *others)
+        ):
+            s = SecretMonad.wrap(value)
+        else:
+            s = SecretMonad._container(value)(value)
+        if s is not self:
+            audit.inherit(s, self, *others)
+            if provenance.enabled and provenance.origin(s) is None:
+                provenance.record(s, op, self, *others)
+        return s
+
     def _dangerous_extract(self) -> T:
         return self._dangerous_map(lambda x: x)
 
@@ -115,7 +424,8 @@ class Secret(Generic[T], SecretMonad):
             Secret.wrap("hello").dangerous_apply(print)
             ```
         """
-        self._dangerous_map(fn, *args, **kwargs)
+        with audit.revealing(self, "apply"):
+            self._dangerous_map(fn, *args, **kwargs)
 
     def dangerous_map(self, fn: MapFn[T, P, T2], *args, **kwargs) -> "Secret[T2]":
         """Apply a function to the secret value, and wrap the result in a new secret.
@@ -140,7 +450,9 @@ class Secret(Generic[T], SecretMonad):
         Raises:
             TypeError: If the return of `fn` cannot be wrapped in a [`Secret`][secret_type.Secret].
         """
-        return SecretMonad.wrap(self._dangerous_map(fn, *args, **kwargs))
+        with audit.revealing(self, "map"):
+            value = self._dangerous_map(fn, *args, **kwargs)
+        return self._derive(value, "map")
 
     @contextmanager
     def dangerous_reveal(self) -> Generator[T, None, None]:
@@ -157,34 +469,80 @@ class Secret(Generic[T], SecretMonad):
                 save_to_db(value)
             ```
         """
-        yield self._dangerous_extract()
+        with audit.revealing(self, "reveal"):
+            yield self._dangerous_extract()
+
+    @classmethod
+    def dangerous_reveal_many(
+        cls,
+        secrets: Iterable["Secret[T]"],
+        workers: Optional[int] = None,
+        chunk_size: int = 1024,
+    ) -> Iterator[T]:
+        """Unwraps many secrets, decrypting them in parallel.
+
+        This is the counterpart to [`wrap_many`][secret_type.monad.SecretMonad.wrap_many].
+        Secrets are read lazily in chunks, and decrypted on a pool of threads.
+        Values are yielded in the same order as `secrets`, with only a bounded number of chunks in memory at once.
+        Each secret counts as one reveal for [auditing][secret_type.audit].
+
+        Args:
+            secrets: The secrets to reveal.
+            workers: The number of threads to use. Defaults to the number of CPUs.
+            chunk_size: The number of secrets to decrypt in each batch.
+
+        Examples: Example:
+            ```python
+            writer.writerows(zip(ids, Secret.dangerous_reveal_many(passwords)))
+            ```
+
+        Raises:
+            ValueError: If `workers` or `chunk_size` is less than 1.
+        """
+
+        def reveal(chunk: List["Secret[T]"]) -> List[T]:
+            values = []
+            for s in chunk:
+                with audit.revealing(s, "reveal"):
+                    values.append(s._dangerous_extract())
+            return values
+
+        return _pipeline(reveal, secrets, workers, chunk_size)
 
     def __eq__(self, o: Union["Secret[T2]", R]) -> "SecretBool":
         a, b = SecretMonad.unwrap(self), SecretMonad.unwrap(o)
         aval = a if isinstance(a, (str, bytes)) else str(a)
         if isinstance(b, type(a)):
             bval = b if isinstance(b, (str, bytes)) else str(b)
-            return SecretBool(secrets.compare_digest(aval, bval))
+            return self._derive(secrets.compare_digest(aval, bval), "eq", o)
         else:
             # If the types don't match, we want to always return False
             bval = type(aval)()
             secrets.compare_digest(aval, bval)
-            return SecretBool(False)
+            return self._derive(False, "eq", o)
 
     def __ne__(self, o: object) -> "SecretBool":
         return self.__eq__(o).flip()
 
     def __add__(self, other) -> "Secret[T]":
-        return Secret.wrap(self._dangerous_extract() + other)
+        return self._derive(
+            self._dangerous_extract() + SecretMonad.unwrap(other), "add", other
+        )
 
     def __radd__(self, other) -> "Secret[T]":
-        return Secret.wrap(other + self._dangerous_extract())
+        return self._derive(
+            SecretMonad.unwrap(other) + self._dangerous_extract(), "radd", other
+        )
 
     def __mul__(self, other) -> "Secret[T]":
-        return Secret.wrap(self._dangerous_extract() * other)
+        return self._derive(
+            self._dangerous_extract() * SecretMonad.unwrap(other), "mul", other
+        )
 
     def __rmul__(self, other) -> "Secret[T]":
-        return Secret.wrap(other * self._dangerous_extract())
+        return self._derive(
+            SecretMonad.unwrap(other) * self._dangerous_extract(), "rmul", other
+        )
 
     def __getattr__(self, name: str) -> Any:
         # Wrap any additional type methods that return a ProtectedValue
@@ -199,7 +557,7 @@ class Secret(Generic[T], SecretMonad):
         def wrapped(*args, **kwargs):
             val = fn(*args, **kwargs)
             try:
-                return SecretMonad.wrap(val)
+                return self._derive(val, name)
             except TypeError:
                 raise NotImplementedError(fn.__name__)
 
@@ -207,4 +565,4 @@ class Secret(Generic[T], SecretMonad):
 
 
 from secret_type.containers.bool import SecretBool
-from secret_type.containers.sequence import SecretStr
+from secret_type.containers.sequence import SecretStr, SecretTokens
@@ -1,9 +1,21 @@
 import secrets
-from typing import Sequence, Type, cast
+from typing import (
+    TYPE_CHECKING,
+    Iterator,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    cast,
+    overload,
+)
 
 from secret_type.containers.secret import Secret
 from secret_type.typing.types import S, T
 
+if TYPE_CHECKING:
+    from secret_type.containers.padded import SecretPaddedStr
+
 
 class SecretStr(Secret[S], Sequence):
     """A specialized subclass of [`Secret[StringLike]`][secret_type.Secret] for holding strings or bytes.
@@ -30,26 +42,85 @@ class SecretStr(Secret[S], Sequence):
             val = self
         elif t is bytes:
             # str -> bytes
-            val = self.dangerous_map(lambda x: cast(str, x).encode())
+            val = self._derive(
+                self._dangerous_map(lambda x: cast(str, x).encode()), "cast"
+            )
         elif t is str:
             # bytes -> str
-            val = self.dangerous_map(lambda x: cast(bytes, x).decode())
+            val = self._derive(
+                self._dangerous_map(lambda x: cast(bytes, x).decode()), "cast"
+            )
         else:
             return super().cast(t, *args, **kwargs)
 
         return cast(Secret[T], val)
 
+    def padded(self, size: Optional[int] = None) -> "SecretPaddedStr[S]":
+        """Converts this secret into a [`SecretPaddedStr`][secret_type.containers.SecretPaddedStr], hiding its length.
+
+        Args:
+            size: The size class to use, overriding the default choice.
+        """
+        from secret_type.containers.padded import SecretPaddedStr
+
+        return self._derive(SecretPaddedStr(self._dangerous_extract(), size), "padded")
+
     def __len__(self):
         return secrets.randbelow(10_000)
 
     def __getitem__(self, index):
-        return self.dangerous_map(lambda x: x[index])
+        return self._derive(self._dangerous_map(lambda x: x[index]), "getitem", index)
 
     def __reverse__(self):
-        return self.dangerous_map(lambda x: x[::-1])
+        return self._derive(self._dangerous_map(lambda x: x[::-1]), "reverse")
 
     def __contains__(self, item):
-        return self.dangerous_map(lambda x: item in x)
+        return self._derive(self._dangerous_map(lambda x: item in x), "contains", item)
 
     def __iter__(self):
         return (Secret(x) for x in self._dangerous_extract())
+
+
+class SecretTokens(Secret[Tuple[S, ...]]):
+    """A batch of tokens, as generated by [`Secret.tokens`][secret_type.Secret.tokens], encrypted together.
+
+    Indexing or iterating yields each token as its own [`SecretStr`][secret_type.containers.SecretStr],
+    and slicing yields a smaller batch.
+    The number of tokens is public.
+
+    Examples: Example:
+        ```python
+        batch = Secret.tokens(1000, 32, batched=True)
+        for api_key in batch:
+            issue(api_key)
+        ```
+    """
+
+    _count: Optional[int] = None
+
+    def __init__(self, tokens: Tuple[S, ...]):
+        super().__init__(tokens)
+        self._count = len(tokens)
+
+    def __len__(self) -> int:
+        # Batches loaded from serialized data only learn their size on first use
+        if self._count is None:
+            self._count = len(self._dangerous_extract())
+        return self._count
+
+    @overload
+    def __getitem__(self, index: int) -> SecretStr[S]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "SecretTokens[S]": ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            # A slice of a batch is still a batch
+            return self._derive(
+                SecretTokens(self._dangerous_map(lambda x: x[index])), "getitem", index
+            )
+        return self._derive(self._dangerous_map(lambda x: x[index]), "getitem", index)
+
+    def __iter__(self) -> Iterator[SecretStr[S]]:
+        return (self._derive(x, "iter") for x in self._dangerous_extract())
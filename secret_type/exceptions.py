@@ -45,6 +45,36 @@ class SecretBoolException(SecretException):
         super().__init__(message)
 
 
+class SecretQuotaException(SecretException):
+    """Raised when a [`Secret`][secret_type.Secret] is revealed more times than its quota allows."""
+
+    def __init__(
+        self,
+        message: str = "Secret has exhausted its quota of reveals",
+    ) -> None:
+        super().__init__(message)
+
+
+class SecretInternException(SecretException):
+    """Raised when a per-instance setting is applied to an [interned][secret_type.intern] [`Secret`][secret_type.Secret], or vice versa."""
+
+    def __init__(
+        self,
+        message: str = "Interned secrets are shared, and cannot have per-instance settings",
+    ) -> None:
+        super().__init__(message)
+
+
+class SecretSerializationException(SecretException):
+    """Raised when a serialized [`Secret`][secret_type.Secret] envelope is malformed or unsupported."""
+
+    def __init__(
+        self,
+        message: str = "Invalid secret envelope",
+    ) -> None:
+        super().__init__(message)
+
+
 class SecretAttributeError(AttributeError, SecretException):
     def __init__(self, s: "Secret", name: str) -> None:
         message = f"{s.protected_type.__name__} has no attribute {name}"
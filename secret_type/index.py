@@ -0,0 +1,215 @@
+"""This module contains containers for looking up secrets by value, without a linear scan.
+
+Secrets cannot be hashed, since a hash of the plain-text would leak information about it.
+Instead, these containers compute a keyed HMAC of each secret (a "blind index") under a per-container key,
+which reveals nothing about the secret without that key. Lookups decrypt only the secret being looked up,
+find candidates by a prefix of its tag, and confirm each candidate by comparing full tags in constant time.
+"""
+
+import hmac
+import os
+from typing import (
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    MutableMapping,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from secret_type.containers.secret import Secret
+from secret_type.typing.types import T
+
+V = TypeVar("V")
+
+_BUCKET_SIZE = 8  # The number of bytes of each tag used to find candidates
+
+
+def _canonical(value: object) -> bytes:
+    # Values are only equal if their types match, as with Secret.__eq__
+    if isinstance(value, bytes):
+        data = value
+    elif isinstance(value, str):
+        data = value.encode()
+    else:
+        data = str(value).encode()
+    return type(value).__name__.encode() + b"\x00" + data
+
+
+def _tag(key: bytes, s: Union[Secret[T], T]) -> bytes:
+    # The blind index of a secret (or plain value) under `key`
+    if isinstance(s, Secret):
+        return s._dangerous_map(lambda x: hmac.digest(key, _canonical(x), "sha256"))
+    return hmac.digest(key, _canonical(s), "sha256")
+
+
+class SecretKeyedDict(MutableMapping[Secret[T], V], Generic[T, V]):
+    """A mapping whose keys are [`Secret`][secret_type.Secret]s, looked up by their value.
+
+    Each lookup decrypts the given secret once, regardless of the size of the mapping.
+    Looking up a plain value is also supported, and is equivalent to looking up its secret.
+
+    Args:
+        items: Initial key-value pairs.
+        key: The key for the blind index. Defaults to a fresh random key.
+
+    Examples: Example:
+        ```python
+        api_keys = SecretKeyedDict((secret(k), user) for k, user in load_api_keys())
+        user = api_keys.get(secret(request.headers["X-API-Key"]))
+        ```
+    """
+
+    def __init__(
+        self,
+        items: Iterable[Tuple[Secret[T], V]] = (),
+        key: Optional[bytes] = None,
+    ) -> None:
+        self._key = os.urandom(32) if key is None else key
+        self._buckets: Dict[bytes, List[Tuple[bytes, Secret[T], V]]] = {}
+        self._len = 0
+        for k, v in items:
+            self[k] = v
+
+    def _find(self, tag: bytes) -> Tuple[List[Tuple[bytes, Secret[T], V]], int]:
+        # Compare against every candidate in the bucket, without stopping early
+        bucket = self._buckets.get(tag[:_BUCKET_SIZE], [])
+        found = -1
+        for i, (candidate, _, _) in enumerate(bucket):
+            if hmac.compare_digest(candidate, tag):
+                found = i
+        return bucket, found
+
+    def _entry(self, s: Union[Secret[T], T]) -> Tuple[Secret[T], V]:
+        bucket, i = self._find(_tag(self._key, s))
+        if i < 0:
+            raise KeyError("Secret not found")
+        return bucket[i][1:]
+
+    def lookup(self, s: Union[Secret[T], T]) -> Optional[Secret[T]]:
+        """Returns the stored key which is equal to `s`, or `None` if there is none."""
+        try:
+            return self._entry(s)[0]
+        except KeyError:
+            return None
+
+    def __getitem__(self, s: Union[Secret[T], T]) -> V:
+        return self._entry(s)[1]
+
+    def __setitem__(self, s: Secret[T], value: V) -> None:
+        s = Secret.wrap(s)
+        tag = _tag(self._key, s)
+        bucket, i = self._find(tag)
+        if i < 0:
+            self._buckets.setdefault(tag[:_BUCKET_SIZE], bucket).append((tag, s, value))
+            self._len += 1
+        else:
+            bucket[i] = (tag, s, value)
+
+    def __delitem__(self, s: Union[Secret[T], T]) -> None:
+        tag = _tag(self._key, s)
+        bucket, i = self._find(tag)
+        if i < 0:
+            raise KeyError("Secret not found")
+        del bucket[i]
+        if not bucket:
+            del self._buckets[tag[:_BUCKET_SIZE]]
+        self._len -= 1
+
+    def __contains__(self, s: object) -> bool:
+        return self._find(_tag(self._key, s))[1] >= 0
+
+    def __iter__(self) -> Iterator[Secret[T]]:
+        for bucket in list(self._buckets.values()):
+            for _, s, _ in bucket:
+                yield s
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(<{len(self)} hidden>)"
+
+    def rekey(self, key: Optional[bytes] = None) -> None:
+        """Rebuilds the blind index under a new key, decrypting every stored secret once.
+
+        Args:
+            key: The new key. Defaults to a fresh random key.
+        """
+        items = [(s, v) for bucket in self._buckets.values() for _, s, v in bucket]
+        self._key = os.urandom(32) if key is None else key
+        self._buckets, self._len = {}, 0
+        for s, v in items:
+            self[s] = v
+
+
+class SecretIndex(Generic[T]):
+    """A set of [`Secret`][secret_type.Secret]s, which can be searched by value.
+
+    See [`SecretKeyedDict`][secret_type.index.SecretKeyedDict] for details.
+
+    Args:
+        secrets: The initial members.
+        key: The key for the blind index. Defaults to a fresh random key.
+
+    Examples: Example:
+        ```python
+        revoked = SecretIndex(secret(t) for t in load_revoked_tokens())
+        if secret(token) in revoked:
+            raise PermissionError()
+        ```
+    """
+
+    def __init__(
+        self, secrets: Iterable[Secret[T]] = (), key: Optional[bytes] = None
+    ) -> None:
+        self._dict: SecretKeyedDict[T, None] = SecretKeyedDict(key=key)
+        for s in secrets:
+            self.add(s)
+
+    def add(self, s: Secret[T]) -> None:
+        """Adds `s` to the index, replacing any equal member."""
+        self._dict[s] = None
+
+    def discard(self, s: Union[Secret[T], T]) -> None:
+        """Removes the member equal to `s`, if there is one."""
+        try:
+            del self._dict[s]
+        except KeyError:
+            pass
+
+    def remove(self, s: Union[Secret[T], T]) -> None:
+        """Removes the member equal to `s`.
+
+        Raises:
+            KeyError: If there is no such member.
+        """
+        del self._dict[s]
+
+    def lookup(self, s: Union[Secret[T], T]) -> Optional[Secret[T]]:
+        """Returns the member equal to `s`, or `None` if there is none."""
+        return self._dict.lookup(s)
+
+    def rekey(self, key: Optional[bytes] = None) -> None:
+        """Rebuilds the blind index under a new key, decrypting every member once.
+
+        Args:
+            key: The new key. Defaults to a fresh random key.
+        """
+        self._dict.rekey(key)
+
+    def __contains__(self, s: object) -> bool:
+        return s in self._dict
+
+    def __iter__(self) -> Iterator[Secret[T]]:
+        return iter(self._dict)
+
+    def __len__(self) -> int:
+        return len(self._dict)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(<{len(self)} hidden>)"
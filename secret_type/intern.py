@@ -0,0 +1,104 @@
+"""This module contains an opt-in intern table, which shares one instance between equal secrets.
+
+Workloads which repeatedly wrap the same value (such as a tenant's API key, wrapped once per request)
+otherwise pay for a new key, ciphertext and cleanup each time.
+[`Secret.intern`][secret_type.Secret.intern] instead returns a shared secret for each distinct value,
+and while interning is enabled, [`Secret.wrap`][secret_type.monad.SecretMonad.wrap]
+(and so every derived secret) does the same automatically.
+
+Values are recognised by an HMAC of their plain-text under a random per-process key,
+so the table itself reveals nothing about them. The table only holds weak references,
+so a shared secret is still destroyed as soon as its last user drops it.
+
+Note:
+    Interned secrets are shared, so per-instance settings such as [`Secret.limited`][secret_type.Secret.limited],
+    [`Secret.cached`][secret_type.Secret.cached] and [`Secret.labeled`][secret_type.Secret.labeled]
+    raise [`SecretInternException`][secret_type.exceptions.SecretInternException] on them.
+    Secrets derived from one with such settings inherit them, so are never interned.
+"""
+
+import os
+import threading
+from contextlib import contextmanager
+from typing import Generator, Optional, Tuple, Type, Union
+from weakref import WeakValueDictionary
+
+from secret_type.containers.secret import Secret
+from secret_type.exceptions import SecretInternException
+from secret_type.index import _tag
+from secret_type.monad import SecretMonad
+from secret_type.typing.types import T
+
+enabled = False
+"""Whether [`Secret.wrap`][secret_type.monad.SecretMonad.wrap] currently interns every value."""
+
+_key = os.urandom(32)
+_lock = threading.Lock()
+_table: "WeakValueDictionary[Tuple[type, object, bytes], Secret]" = WeakValueDictionary()
+
+
+def enable() -> None:
+    """Starts interning every wrapped or derived secret."""
+    global enabled
+    enabled = True
+
+
+def disable() -> None:
+    """Stops interning automatically. Already-interned secrets remain shared."""
+    global enabled
+    enabled = False
+
+
+@contextmanager
+def interning() -> Generator[None, None, None]:
+    """A context manager which interns every wrapped or derived secret for its duration."""
+    previous = enabled
+    enable()
+    try:
+        yield
+    finally:
+        if not previous:
+            disable()
+
+
+def clear() -> None:
+    """Empties the intern table. Existing secrets are unaffected, but are no longer shared with new ones."""
+    with _lock:
+        _table.clear()
+
+
+def intern(
+    value: Union[Secret[T], T], container: Optional[Type[Secret[T]]] = None
+) -> Secret[T]:
+    """Returns the shared secret equal to `value`, interning it if there is none.
+
+    Prefer [`Secret.intern`][secret_type.Secret.intern], which calls this function.
+
+    Args:
+        value: A secret, or a primitive value to wrap.
+        container: The type of secret to wrap a primitive value in.
+            Defaults to the type [`Secret.wrap`][secret_type.monad.SecretMonad.wrap] would use.
+
+    Raises:
+        TypeError: If `value` is not a primitive value or a secret.
+        SecretInternException: If `value` is a secret with per-instance settings, such as a quota.
+    """
+    if isinstance(value, Secret):
+        if not value._interned and value._has_private_state():
+            raise SecretInternException()
+        container = type(value)
+    else:
+        if container is None:
+            container = SecretMonad._container(value)
+        value = container._normalize(value)
+    key = (container, container._shape(value), _tag(_key, value))
+    with _lock:
+        shared = _table.get(key)
+    if shared is not None:
+        return shared
+    # Encrypt outside of the lock. If another thread wins the race, its secret is used instead
+    s = value if isinstance(value, Secret) else container._from_value(value)
+    with _lock:
+        shared = _table.setdefault(key, s)
+        shared._interned = True
+        return shared
@@ -1,10 +1,65 @@
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from numbers import Number, Rational
-from typing import TYPE_CHECKING, Union, overload
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Type,
+    Union,
+    overload,
+)
 
 if TYPE_CHECKING:
     from secret_type.containers.secret import Secret
 
-from secret_type.typing.types import R, T
+from secret_type.typing.types import R, T, T2
+
+
+def _pipeline(
+    fn: Callable[[List[T]], List[T2]],
+    items: Iterable[T],
+    workers: Optional[int],
+    chunk_size: int,
+) -> Iterator[T2]:
+    # Validate eagerly, so bad arguments fail at the call rather than on first iteration
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1, got {}".format(chunk_size))
+    if workers is None:
+        workers = os.cpu_count() or 1
+    elif workers < 1:
+        raise ValueError("workers must be at least 1, got {}".format(workers))
+    return _chunked(fn, items, workers, chunk_size)
+
+
+def _chunked(
+    fn: Callable[[List[T]], List[T2]],
+    items: Iterable[T],
+    workers: int,
+    chunk_size: int,
+) -> Iterator[T2]:
+    # Apply fn to chunks of items on a thread pool, yielding results in order,
+    # with at most two chunks per worker in flight at once
+    it = iter(items)
+    chunks = iter(lambda: list(islice(it, chunk_size)), [])
+    if workers == 1:
+        for chunk in chunks:
+            yield from fn(chunk)
+        return
+
+    with ThreadPoolExecutor(workers) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(fn, chunk))
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
 
 
 class SecretMonad:
@@ -28,6 +83,7 @@ class SecretMonad:
         """Wraps a value in the appropriate [`Secret`][secret_type.Secret] container.
 
         If the value is already a [`Secret`][secret_type.Secret], it is returned as-is.
+        While [interning][secret_type.intern] is enabled, equal values share a single instance.
 
         Attributes:
             o (Union[str, bytes, int, float, bool]): The value to wrap.
@@ -40,24 +96,68 @@ class SecretMonad:
         Raises:
             TypeError: If `o` is not a primitive value.
         """
+        from secret_type import intern
+        from secret_type.containers.secret import Secret
+
+        if isinstance(o, Secret):
+            return o
+        elif intern.enabled:
+            return intern.intern(o)
+        else:
+            return cls._container(o)(o)
+
+    @staticmethod
+    def _container(o: T) -> Type["Secret[T]"]:
+        # The container type which wrap uses for a primitive value
         from secret_type.containers.bool import SecretBool
         from secret_type.containers.number import SecretNumber
         from secret_type.containers.secret import Secret
         from secret_type.containers.sequence import SecretStr
 
-        if isinstance(o, Secret):
-            return o
-        elif isinstance(o, (str, bytes)):
-            return SecretStr(o)
+        if isinstance(o, (str, bytes)):
+            return SecretStr
         elif isinstance(o, bool):
-            return SecretBool(o)
+            return SecretBool
         elif isinstance(o, Rational):
-            return SecretNumber(o)
+            return SecretNumber
         elif isinstance(o, Number):
-            return Secret(o)
+            return Secret
         else:
             raise TypeError("Cannot wrap type '{}'".format(type(o).__name__))
 
+    @classmethod
+    def wrap_many(
+        cls,
+        values: Iterable[Union[T, "Secret[T]"]],
+        workers: Optional[int] = None,
+        chunk_size: int = 1024,
+    ) -> Iterator["Secret[T]"]:
+        """Wraps many values, encrypting them in parallel.
+
+        Values are read lazily in chunks, which are wrapped on a pool of threads
+        (the underlying cryptographic primitives release the GIL).
+        Secrets are yielded in the same order as `values`, and only a bounded number of chunks
+        are held in memory at once, so this is suitable for streams of any length.
+
+        Attributes:
+            values (Iterable[Union[str, bytes, int, float, bool]]): The values to wrap.
+            workers (Optional[int]): The number of threads to use. Defaults to the number of CPUs.
+            chunk_size (int): The number of values to wrap in each batch.
+
+        Examples: Example:
+            ```python
+            for row, password in zip(rows, Secret.wrap_many(row["password"] for row in rows)):
+                row["password"] = password
+            ```
+
+        Raises:
+            TypeError: If any value is not a primitive value.
+            ValueError: If `workers` or `chunk_size` is less than 1.
+        """
+        return _pipeline(
+            lambda chunk: [cls.wrap(o) for o in chunk], values, workers, chunk_size
+        )
+
     @overload
     @classmethod
     def unwrap(cls, o: "Secret[T]") -> T:
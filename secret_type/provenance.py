@@ -0,0 +1,288 @@
+"""This module contains an opt-in provenance tracker, recording where derived secrets came from.
+
+Secrets are "viral", so a single sensitive value can quickly spread into many derived secrets.
+When tracking is enabled, every derivation from a tracked secret is recorded in a compact side table,
+allowing the origin of any secret to be queried (for example, when it is revealed).
+
+A secret becomes tracked by giving it an origin label with [`Secret.labeled`][secret_type.Secret.labeled].
+Labels are interned to integer IDs, and each derivation costs a handful of bytes in the table
+(one label ID, one offset, and one ID per parent secret), plus a small handle while the derived secret is alive:
+around 100 bytes in total, as measured by `benchmarks/bench_provenance.py`.
+Secrets which do not descend from a labeled secret are never recorded.
+
+When a tracked secret is destroyed, its entry is kept only while a live secret still descends from it.
+The table is compacted once enough secrets have been destroyed, so its size is bounded by the history
+of the secrets which are still alive, rather than by every derivation ever made.
+"""
+
+import threading
+from array import array
+from collections import deque
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Dict, Generator, List, NamedTuple, Optional, Tuple
+
+if TYPE_CHECKING:
+    from secret_type.containers.secret import Secret
+
+enabled = False
+"""Whether derivations are currently being recorded."""
+
+_COMPACT_MIN = 1024  # the fewest destroyed secrets which trigger a compaction
+
+
+class _Node:
+    # A tracked secret's position in the table, updated in place when the table is compacted
+    __slots__ = ("index",)
+
+    def __init__(self, index: int) -> None:
+        self.index = index
+
+
+_lock = threading.Lock()
+_labels: List[str] = []
+_label_ids: Dict[str, int] = {}
+_origins = array("I")  # node -> label ID
+_offsets = array("I")  # node -> end of its parents in _edges
+_edges = array("I")  # flattened parent nodes
+_owners: Dict[int, _Node] = {}  # node -> handle of the live secret it belongs to
+_released: "deque[_Node]" = deque()  # handles of destroyed secrets, not yet processed
+_pending = 0  # nodes released since the last compaction
+_retained = 0  # the size of the table after the last compaction
+
+
+class Lineage(NamedTuple):
+    """The recorded history of a secret."""
+
+    label: str
+    """The label the secret was created with."""
+    parents: Tuple["Lineage", ...]
+    """The lineages of the tracked secrets it was derived from."""
+
+
+def enable() -> None:
+    """Starts recording derivations of tracked secrets."""
+    global enabled
+    enabled = True
+
+
+def disable() -> None:
+    """Stops recording derivations. Already-recorded history is kept."""
+    global enabled
+    enabled = False
+
+
+@contextmanager
+def tracking() -> Generator[None, None, None]:
+    """A context manager which records derivations for its duration."""
+    previous = enabled
+    enable()
+    try:
+        yield
+    finally:
+        if not previous:
+            disable()
+
+
+def reset() -> None:
+    """Discards all recorded history.
+
+    Secrets tracked before the reset are no longer tracked afterwards.
+    """
+    global _origins, _offsets, _edges, _pending, _retained
+    with _lock:
+        for handle in _owners.values():
+            handle.index = -1
+        _owners.clear()
+        _released.clear()
+        _labels.clear()
+        _label_ids.clear()
+        _origins, _offsets, _edges = array("I"), array("I"), array("I")
+        _pending = _retained = 0
+
+
+def release(s: "Secret") -> None:
+    """Marks `s` as destroyed, so its history can be reclaimed once nothing descends from it.
+
+    This is called when a tracked secret is deleted. It never blocks, and may be called from any thread.
+    """
+    handle = s._provenance
+    if handle is not None:
+        _released.append(handle)
+
+
+def _collect() -> None:
+    # Process released secrets, and compact the table if enough have been released. Called with _lock held
+    global _pending
+    while _released:
+        handle = _released.popleft()
+        if _owners.get(handle.index) is handle:
+            del _owners[handle.index]
+            _pending += 1
+        handle.index = -1
+    if _pending >= max(_COMPACT_MIN, _retained):
+        _compact()
+
+
+def _compact() -> None:
+    # Keep only the nodes reachable from a live secret, preserving their order (parents before children)
+    global _origins, _offsets, _edges, _owners, _pending, _retained
+    keep = bytearray(len(_origins))
+    stack = list(_owners)
+    while stack:
+        node = stack.pop()
+        if not keep[node]:
+            keep[node] = 1
+            stack.extend(_parents(node))
+
+    mapping: Dict[int, int] = {}
+    origins, offsets, edges = array("I"), array("I"), array("I")
+    for node in range(len(_origins)):
+        if keep[node]:
+            mapping[node] = len(origins)
+            origins.append(_origins[node])
+            edges.extend(mapping[p] for p in _parents(node))
+            offsets.append(len(edges))
+
+    owners = {}
+    for node, handle in _owners.items():
+        handle.index = mapping[node]
+        owners[handle.index] = handle
+    _origins, _offsets, _edges, _owners = origins, offsets, edges, owners
+    _pending, _retained = 0, len(origins)
+
+
+def _intern(label: str) -> int:
+    try:
+        return _label_ids[label]
+    except KeyError:
+        _labels.append(label)
+        return _label_ids.setdefault(label, len(_labels) - 1)
+
+
+def _node(s: object) -> int:
+    # Anything that is not a secret is untracked, as are secrets from before the last reset
+    handle = getattr(s, "_provenance", None)
+    return -1 if handle is None else handle.index
+
+
+def _own(s: "Secret", label: str) -> None:
+    # Append a node for `s`, replacing any node it already had. Called with _lock held
+    global _pending
+    _origins.append(_intern(label))
+    _offsets.append(len(_edges))
+    node = len(_origins) - 1
+    handle = s._provenance
+    if handle is None:
+        s._provenance = handle = _Node(node)
+    elif _owners.get(handle.index) is handle:
+        del _owners[handle.index]
+        _pending += 1
+    handle.index = node
+    _owners[node] = handle
+
+
+def record(s: "Secret", label: str, *parents: object) -> None:
+    """Records that `s` was derived from `parents` by the operation named `label`.
+
+    Only parents which are tracked secrets are recorded.
+    If none of them are, `s` is left untracked.
+
+    Args:
+        s: The newly-derived secret.
+        label: The operation which derived `s`.
+        parents: The operands `s` was derived from. Anything that is not a tracked secret is ignored.
+    """
+    with _lock:
+        _collect()
+        nodes = [n for n in map(_node, parents) if n >= 0]
+        if not nodes:
+            return
+        _edges.extend(nodes)
+        _own(s, label)
+
+
+def label(s: "Secret", label: str) -> None:
+    """Tracks `s` as a root secret with the origin label `label`.
+
+    Prefer [`Secret.labeled`][secret_type.Secret.labeled], which calls this function.
+    """
+    with _lock:
+        _collect()
+        _own(s, label)
+
+
+def _parents(node: int) -> "array[int]":
+    return _edges[_offsets[node - 1] if node else 0 : _offsets[node]]
+
+
+def origin(s: "Secret") -> Optional[str]:
+    """Returns the label `s` was created with, or `None` if it is untracked."""
+    with _lock:
+        node = _node(s)
+        return None if node < 0 else _labels[_origins[node]]
+
+
+def roots(s: "Secret") -> List[str]:
+    """Returns the labels of the root secrets `s` was derived from, in order of first appearance.
+
+    Examples: Example:
+        ```python
+        password = secret("hunter2").labeled("db-password")
+        with provenance.tracking():
+            derived = password.upper() + "!"
+        assert provenance.roots(derived) == ["db-password"]
+        ```
+    """
+    return _roots(getattr(s, "_provenance", None))
+
+
+def _roots(handle: Optional[_Node]) -> List[str]:
+    # The roots of the secret with provenance `handle`, which need not be alive
+    with _lock:
+        node = -1 if handle is None else handle.index
+        return [] if node < 0 else _walk_roots(node)
+
+
+def _walk_roots(node: int) -> List[str]:
+    # Called with _lock held, so the table is not compacted underneath the walk
+    found: Dict[str, None] = {}
+    seen, stack = set(), [node]
+    while stack:
+        node = stack.pop()
+        if node in seen:
+            continue
+        seen.add(node)
+        parents = _parents(node)
+        if parents:
+            stack.extend(reversed(parents))
+        else:
+            found[_labels[_origins[node]]] = None
+    return list(found)
+
+
+def lineage(s: "Secret") -> Optional[Lineage]:
+    """Returns the full recorded history of `s`, or `None` if it is untracked."""
+    with _lock:
+        node = _node(s)
+        return None if node < 0 else _walk_lineage(node)
+
+
+def _walk_lineage(root: int) -> Lineage:
+    # Build each node once, after all of its parents, without recursing.
+    # Called with _lock held, so the table is not compacted underneath the walk
+    built: Dict[int, Lineage] = {}
+    stack = [root]
+    while stack:
+        node = stack[-1]
+        if node in built:
+            stack.pop()
+            continue
+        missing = [p for p in _parents(node) if p not in built]
+        if missing:
+            stack.extend(missing)
+            continue
+        stack.pop()
+        built[node] = Lineage(
+            _labels[_origins[node]], tuple(built[p] for p in _parents(node))
+        )
+    return built[root]
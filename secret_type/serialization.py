@@ -0,0 +1,225 @@
+"""This module contains a versioned envelope format for persisting and transporting secrets without revealing them.
+
+An envelope consists of a header, followed by any number of records:
+
+- The header holds a magic string, the format version, and a fresh data key wrapped
+  under an application-supplied key-encryption key (KEK).
+- Each record holds a type tag and the secret's contents, encrypted under the data key.
+
+Secrets are never written in plain-text, and loading an envelope adopts the stored ciphertext directly,
+so no per-secret key generation or re-encryption is needed to warm-start from a snapshot.
+
+The type tag of each record must match the secret's type exactly. Containers defined outside this library
+must be [registered][secret_type.serialization.register] before they can be serialized.
+"""
+
+import base64
+import io
+import struct
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Type, Union
+
+from cryptography.fernet import Fernet, InvalidToken, MultiFernet
+
+from secret_type import provenance
+from secret_type.containers import (
+    Secret,
+    SecretBool,
+    SecretI64,
+    SecretNumber,
+    SecretPaddedStr,
+    SecretStr,
+    SecretTokens,
+    SecretU64,
+    SecretU256,
+)
+from secret_type.exceptions import SecretSerializationException
+
+MAGIC = b"SECT"
+"""The magic string at the start of every envelope."""
+VERSION = 1
+"""The current version of the envelope format."""
+
+KeyEncryptionKey = Union[Fernet, MultiFernet, bytes]
+"""A key used to wrap the data key of an envelope. Raw keys must be [`Fernet`][cryptography.fernet.Fernet] keys."""
+
+_HEADER = struct.Struct(">4sBH")  # magic, version, wrapped data key length
+_RECORD = struct.Struct(">BI")  # type tag, ciphertext length
+
+_TAGS: Dict[Type[Secret], int] = {
+    Secret: 0,
+    SecretStr: 1,
+    SecretBool: 2,
+    SecretNumber: 3,
+    SecretU64: 4,
+    SecretI64: 5,
+    SecretU256: 6,
+    SecretPaddedStr: 7,
+    SecretTokens: 8,
+}
+_TYPES: Dict[int, Type[Secret]] = {v: k for k, v in _TAGS.items()}
+
+MIN_USER_TAG = 64
+"""Tags below this value are reserved for the containers in this library."""
+
+
+def register(cls: Type[Secret], tag: int) -> None:
+    """Allows secrets of exactly type `cls` to be serialized, under the given type tag.
+
+    Only registered types can be serialized, so that each secret loads as the same type it was dumped as.
+    Subclasses of a registered type must be registered separately. The same tag must be used to load envelopes
+    written with it, so tags should never be reused for a different type.
+
+    Args:
+        cls: The container type to register.
+        tag: A type tag between [`MIN_USER_TAG`][secret_type.serialization.MIN_USER_TAG] and 255.
+
+    Raises:
+        ValueError: If the tag is out of range, or either the tag or the type is already registered.
+
+    Examples: Example:
+        ```python
+        class DatabaseCredentials(SecretRecord):
+            username: str
+            password: str
+
+        serialization.register(DatabaseCredentials, 64)
+        ```
+    """
+    if not MIN_USER_TAG <= tag <= 255:
+        raise ValueError(
+            "Type tags must be between {} and 255, not {}".format(MIN_USER_TAG, tag)
+        )
+    if _TYPES.get(tag, cls) is not cls or _TAGS.get(cls, tag) != tag:
+        raise ValueError(
+            "Cannot register '{}' with tag {}: already in use".format(cls.__name__, tag)
+        )
+    _TAGS[cls] = tag
+    _TYPES[tag] = cls
+
+
+def _kek(kek: KeyEncryptionKey) -> Union[Fernet, MultiFernet]:
+    return Fernet(kek) if isinstance(kek, bytes) else kek
+
+
+def _read(fp: BinaryIO, n: int) -> bytes:
+    data = fp.read(n)
+    if len(data) != n:
+        raise SecretSerializationException("Truncated secret envelope")
+    return data
+
+
+def _tag(s: Secret) -> int:
+    # Only exact matches, since a subclass may encode its contents differently
+    try:
+        return _TAGS[type(s)]
+    except KeyError:
+        raise TypeError(
+            "Cannot serialize unregistered type '{}'".format(type(s).__name__)
+        ) from None
+
+
+def dump(secrets: Iterable[Secret], fp: BinaryIO, kek: KeyEncryptionKey) -> int:
+    """Streams secrets into an envelope, without revealing them.
+
+    Args:
+        secrets: The secrets to serialize. This may be any iterable, including a generator.
+        fp: A binary file-like object to write the envelope to.
+        kek: The key-encryption key used to wrap the envelope's data key.
+
+    Returns:
+        The number of secrets written.
+
+    Raises:
+        TypeError: If a secret's type is not [registered][secret_type.serialization.register].
+            Any secrets before it will already have been written.
+        ValueError: If a secret has a [reveal limit][secret_type.Secret.limited] or [provenance][secret_type.provenance],
+            which cannot be carried over to the loaded copy. Any secrets before it will already have been written.
+
+    Examples: Example:
+        ```python
+        kek = Fernet(os.environ["SNAPSHOT_KEY"])
+        with open("secrets.bin", "wb") as f:
+            serialization.dump(secrets, f, kek)
+        ```
+    """
+    data_key = Fernet.generate_key()
+    wrapped = base64.urlsafe_b64decode(_kek(kek).encrypt(data_key))
+    fp.write(_HEADER.pack(MAGIC, VERSION, len(wrapped)))
+    fp.write(wrapped)
+
+    f, count = Fernet(data_key), 0
+    for s in secrets:
+        tag = _tag(s)
+        if s._quotas or provenance._node(s) >= 0:
+            raise ValueError(
+                "Cannot serialize a secret with a reveal limit or provenance"
+            )
+        token = base64.urlsafe_b64decode(f.encrypt(s._decrypt()))
+        fp.write(_RECORD.pack(tag, len(token)))
+        fp.write(token)
+        count += 1
+    return count
+
+
+def load(fp: BinaryIO, kek: KeyEncryptionKey) -> Iterator[Secret]:
+    """Streams secrets out of an envelope, without revealing them.
+
+    The header is validated immediately; records are read lazily as the result is iterated.
+    Loaded secrets share the envelope's data key, and adopt its ciphertext as-is.
+    Tampering with a record is detected the first time that secret is used.
+
+    Args:
+        fp: A binary file-like object to read the envelope from.
+        kek: The key-encryption key used to unwrap the envelope's data key.
+
+    Returns:
+        An iterator of [`Secret`][secret_type.Secret] objects, in the order they were written.
+
+    Raises:
+        SecretSerializationException: If the envelope is malformed, of an unsupported version,
+            or was not written with `kek`.
+    """
+    magic, version, size = _HEADER.unpack(_read(fp, _HEADER.size))
+    if magic != MAGIC:
+        raise SecretSerializationException()
+    if version != VERSION:
+        raise SecretSerializationException(
+            "Unsupported secret envelope version {}".format(version)
+        )
+    try:
+        data_key = _kek(kek).decrypt(base64.urlsafe_b64encode(_read(fp, size)))
+    except InvalidToken:
+        raise SecretSerializationException("Invalid key-encryption key") from None
+
+    def records() -> Iterator[Secret]:
+        while True:
+            header = fp.read(_RECORD.size)
+            if not header:
+                return
+            if len(header) != _RECORD.size:
+                raise SecretSerializationException("Truncated secret envelope")
+            tag, size = _RECORD.unpack(header)
+            if tag not in _TYPES:
+                raise SecretSerializationException("Unknown secret type {}".format(tag))
+            token = base64.urlsafe_b64encode(_read(fp, size))
+            yield _TYPES[tag]._from_sealed(data_key, token)
+
+    return records()
+
+
+def dumps(secrets: Iterable[Secret], kek: KeyEncryptionKey) -> bytes:
+    """Serializes secrets into an envelope held in memory.
+
+    See [`dump`][secret_type.serialization.dump] for details.
+    """
+    buf = io.BytesIO()
+    dump(secrets, buf, kek)
+    return buf.getvalue()
+
+
+def loads(data: bytes, kek: KeyEncryptionKey) -> List[Secret]:
+    """Deserializes every secret in an envelope held in memory.
+
+    See [`load`][secret_type.serialization.load] for details.
+    """
+    return list(load(io.BytesIO(data), kek))
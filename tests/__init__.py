@@ -1,3 +1,10 @@
 # SPDX-FileCopyrightText: 2022-present Yasyf Mohamedali <yasyfm@gmail.com>
 #
 # SPDX-License-Identifier: MIT
+
+from secret_type import Secret
+
+
+def reveal(s: Secret):
+    with s.dangerous_reveal() as value:
+        return value
@@ -0,0 +1,88 @@
+from typing import List
+
+import pytest
+
+from secret_type import Secret, audit, provenance
+from secret_type.audit import AuditEvent
+from secret_type.exceptions import SecretQuotaException
+
+
+class TestAudit:
+    @pytest.fixture
+    def events(self):
+        events: List[AuditEvent] = []
+        audit.install(events.extend, interval=60)
+        yield events
+        audit.uninstall()
+
+    def test_reveals_are_recorded(self, events: List[AuditEvent]):
+        s = Secret.wrap("hunter2").labeled("password")
+
+        with s.dangerous_reveal():
+            pass
+        s.dangerous_apply(len)
+        s.dangerous_map(len)
+        s.cast(bytes)
+        assert events == []
+
+        audit.auditor.flush()
+        assert [e.kind for e in events] == ["reveal", "apply", "map"]
+        assert all(e.container == "SecretStr" for e in events)
+        assert all(e.labels == ("password",) for e in events)
+        assert all(e.site.startswith(__file__) for e in events)
+        provenance.reset()
+
+    def test_labels_are_resolved_when_flushed(
+        self, events: List[AuditEvent], monkeypatch
+    ):
+        s = Secret.wrap("hunter2").labeled("password")
+        with monkeypatch.context() as m:
+            m.setattr(provenance, "_roots", None)
+            s.dangerous_apply(len)
+
+        audit.auditor.flush()
+        assert [e.labels for e in events] == [("password",)]
+        provenance.reset()
+
+    def test_ring_buffer(self):
+        auditor = audit.Auditor(lambda events: None, capacity=2)
+        for _ in range(3):
+            auditor.record(AuditEvent("reveal", "Secret", (), "", 0, 0, 0))
+        assert auditor.dropped == 1
+
+    def test_quota(self):
+        s = Secret.wrap(42).limited(2)
+        s.dangerous_apply(print)
+        s + 1
+        with s.dangerous_reveal() as revealed:
+            assert revealed == 42
+
+        with pytest.raises(SecretQuotaException):
+            s.dangerous_map(str)
+
+    def test_quota_is_shared_with_derived_secrets(self):
+        s = Secret.wrap("hunter2").limited(2)
+        copies = [s[:], s + "", s.upper(), s.cast(bytes), (s == "x") & True]
+        with copies[0].dangerous_reveal():
+            pass
+        with copies[3].dangerous_reveal():
+            pass
+        for c in [s, *copies]:
+            with pytest.raises(SecretQuotaException):
+                c.dangerous_apply(print)
+
+        # Exhausted limits also apply to secrets derived later
+        with pytest.raises(SecretQuotaException):
+            s.upper().dangerous_apply(print)
+
+    def test_quota_from_operands(self):
+        pepper = Secret.wrap("pepper").limited(0)
+        with pytest.raises(SecretQuotaException):
+            (Secret.wrap("salt") + pepper).dangerous_apply(print)
+
+    def test_limits_accumulate(self):
+        s = Secret.wrap(1).limited(1)
+        derived = (s + 1).limited(5)
+        derived.dangerous_apply(print)
+        with pytest.raises(SecretQuotaException):
+            derived.dangerous_apply(print)
@@ -0,0 +1,76 @@
+import pytest
+
+from secret_type import Secret
+from secret_type.containers import SecretBool
+from secret_type.exceptions import SecretBoolException
+from tests import reveal
+
+
+class TestSecretBool:
+    @pytest.fixture
+    def yes(self) -> SecretBool:
+        return SecretBool(True)
+
+    @pytest.fixture
+    def no(self) -> SecretBool:
+        return SecretBool(False)
+
+    def test_algebra(self, yes: SecretBool, no: SecretBool):
+        assert reveal(yes & no) is False
+        assert reveal(yes | no) is True
+        assert reveal(yes ^ no) is True
+        assert reveal(~yes) is False
+        assert reveal(no.flip()) is True
+        assert reveal(True & no) is False
+        assert reveal((yes & ~no) ^ (no | False)) is True
+
+        with pytest.raises(SecretBoolException):
+            if yes & no:
+                pass
+        with pytest.raises(TypeError):
+            yes & Secret.wrap("foo")
+
+    def test_reductions(self, yes: SecretBool, no: SecretBool):
+        assert reveal(SecretBool.all([yes, True, yes])) is True
+        assert reveal(SecretBool.all([yes, no])) is False
+        assert reveal(SecretBool.all([])) is True
+        assert reveal(SecretBool.any([no, False, yes])) is True
+        assert reveal(SecretBool.any([])) is False
+
+    def test_batched_evaluation(self, yes: SecretBool, no: SecretBool, monkeypatch):
+        password = Secret.wrap("hunter2")
+        check = SecretBool.all([password == "hunter2", ~no, yes | no, yes])
+
+        decrypts = []
+        decrypt = Secret._decrypt
+        monkeypatch.setattr(
+            Secret, "_decrypt", lambda self: decrypts.append(self) or decrypt(self)
+        )
+        assert reveal(check) is True
+        # Each distinct operand is decrypted once, then the sealed result once
+        assert len(decrypts) == len(set(map(id, decrypts))) == 4
+
+    def test_select(self, yes: SecretBool, no: SecretBool):
+        assert reveal(yes.select(1, 2)) == 1
+        assert reveal(no.select(-1, 2**70)) == 2**70
+        assert reveal(yes.select(Secret.wrap("secret"), "")) == "secret"
+        assert reveal(no.select("secret", "")) == ""
+        assert reveal((yes & no).select(b"a\x00", b"bcd")) == b"bcd"
+        assert reveal(yes.select(b"a\x00", b"bcd")) == b"a\x00"
+        assert reveal(no.select(True, False)) is False
+
+        with pytest.raises(TypeError):
+            yes.select("str", b"bytes")
+
+    def test_long_chains(self):
+        leaf = SecretBool(True)
+        acc = leaf
+        for i in range(3000):
+            acc = acc & leaf
+            acc = acc | False if i % 100 == 0 else acc
+        assert str(acc) == "True"
+
+        mixed = SecretBool(False)
+        for i in range(3000):
+            mixed = (mixed | False) & True
+        assert str(mixed) == "False"
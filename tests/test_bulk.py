@@ -0,0 +1,45 @@
+import pytest
+
+from secret_type import Secret
+from secret_type.containers import SecretNumber, SecretStr
+
+
+class TestBulk:
+    @pytest.mark.parametrize("workers", [1, 4])
+    def test_roundtrip(self, workers: int):
+        values = (f"value-{i}" if i % 2 else i for i in range(200))
+        secrets = list(Secret.wrap_many(values, workers=workers, chunk_size=16))
+
+        assert len(secrets) == 200
+        assert isinstance(secrets[0], SecretNumber)
+        assert isinstance(secrets[1], SecretStr)
+
+        revealed = Secret.dangerous_reveal_many(
+            iter(secrets), workers=workers, chunk_size=30
+        )
+        assert list(revealed) == [f"value-{i}" if i % 2 else i for i in range(200)]
+
+    def test_lazy(self):
+        consumed = []
+
+        def values():
+            for i in range(10_000):
+                consumed.append(i)
+                yield i
+
+        first = next(Secret.wrap_many(values(), workers=2, chunk_size=10))
+        assert first._dangerous_extract() == 0
+        assert len(consumed) <= 10 * 2 * 2 + 10
+
+    def test_errors(self):
+        with pytest.raises(TypeError):
+            list(Secret.wrap_many([1, object()], workers=2))
+
+    @pytest.mark.parametrize(
+        "kwargs", [{"workers": 0}, {"workers": -1}, {"chunk_size": 0}]
+    )
+    def test_invalid_arguments(self, kwargs: dict):
+        with pytest.raises(ValueError):
+            Secret.wrap_many([1, 2], **kwargs)
+        with pytest.raises(ValueError):
+            Secret.dangerous_reveal_many([Secret.wrap(1)], **kwargs)
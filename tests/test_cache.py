@@ -0,0 +1,80 @@
+import gc
+
+import pytest
+
+from secret_type import Secret
+from secret_type.cache import SecretCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestSecretCache:
+    @pytest.fixture
+    def clock(self) -> FakeClock:
+        return FakeClock()
+
+    @pytest.fixture
+    def cache(self, clock: FakeClock) -> SecretCache:
+        return SecretCache(max_bytes=64, clock=clock)
+
+    def test_cached_reads(self, cache: SecretCache, monkeypatch):
+        secret = Secret.wrap("hunter2").cached(ttl=10, cache=cache)
+        with secret.dangerous_reveal() as revealed:
+            assert revealed == "hunter2"
+        assert len(cache) == 1
+
+        monkeypatch.setattr("cryptography.fernet.Fernet.decrypt", None)
+        with secret.dangerous_reveal() as revealed:
+            assert revealed == "hunter2"
+
+    def test_ttl_expiry(self, cache: SecretCache, clock: FakeClock):
+        cache.put(1, b"foo", ttl=5)
+        assert cache.get(1) == b"foo"
+
+        clock.now = 5
+        assert cache.get(1) is None
+        assert len(cache) == 0
+
+    def test_max_bytes_eviction_wipes(self, cache: SecretCache):
+        cache.put(1, b"a" * 40, ttl=5)
+        evicted = cache._entries[1].plaintext
+        cache.put(2, b"b" * 40, ttl=5)
+
+        assert cache.get(1) is None
+        assert cache.get(2) == b"b" * 40
+        assert evicted == bytes(40)
+        assert cache.nbytes == 40
+
+    def test_invalidate(self, cache: SecretCache):
+        secret = Secret.wrap(42).cached(ttl=10, cache=cache)
+        secret.dangerous_apply(lambda x: x)
+        secret.uncached()
+        assert len(cache) == 0
+
+        secret = Secret.wrap(42).cached(ttl=10, cache=cache)
+        secret.dangerous_apply(lambda x: x)
+        del secret
+        assert len(cache) == 0
+
+    def test_collected_during_put(self, cache: SecretCache, monkeypatch):
+        class Cycle:
+            pass
+
+        cycle = Cycle()
+        cycle.self = cycle
+        cycle.secret = Secret.wrap(42).cached(ttl=10, cache=cache)
+        cycle.secret.dangerous_apply(lambda x: x)
+        del cycle
+
+        # Finalize the secret while put holds the lock, as an automatic collection would
+        purge = cache._purge
+        monkeypatch.setattr(cache, "_purge", lambda: (gc.collect(), purge())[1])
+        cache.put(1, b"foo", ttl=10)
+        assert cache.get(1) == b"foo"
+        assert len(cache) == 1
@@ -0,0 +1,83 @@
+import pytest
+
+from secret_type import Secret
+from secret_type.containers import SecretI64, SecretU64, SecretU256
+from secret_type.exceptions import SecretBoolException, SecretException
+from tests import reveal
+
+
+class TestSecretFixedInt:
+    def test_wraparound(self):
+        assert reveal(SecretU64(2**64 - 1) + 1) == 0
+        assert reveal(SecretU64(0) - 1) == 2**64 - 1
+        assert reveal(SecretI64(2**63 - 1) + 1) == -(2**63)
+        assert reveal(-SecretI64(5)) == -5
+
+    def test_arithmetic(self):
+        a, b = 0xDEADBEEFCAFEBABE, 0x0123456789ABCDEF
+        for cls in (SecretU64, SecretU256):
+            mask = 2**cls.BITS - 1
+            x, y = cls(a), cls(b)
+            assert reveal(x + y) == (a + b) & mask
+            assert reveal(y - x) == (b - a) & mask
+            assert reveal(x * y) == (a * b) & mask
+            assert reveal(x * b * x * y) == (a * b * a * b) & mask
+            assert reveal(x & y) == a & b
+            assert reveal(x | y) == a | b
+            assert reveal(x ^ y) == a ^ b
+            assert reveal(~x) == ~a & mask
+            for n in (0, 1, 31, 32, 33, 63, 64, 200, 300):
+                assert reveal(x << n) == (a << n) & mask
+                assert reveal(x >> n) == a >> n
+
+    def test_signed(self):
+        x = SecretI64(-12345)
+        assert reveal(x * 3) == -37035
+        assert reveal(x >> 4) == -12345 >> 4
+        assert str(x < 0) == "True"
+        assert str(x > SecretI64(-20000)) == "True"
+        assert str(x >= -12345) == "True"
+        assert str(x <= -12346) == "False"
+
+    def test_comparisons(self):
+        x = SecretU256(2**200)
+        assert str(x == 2**200) == "True"
+        assert str(x != 2**200 + 1) == "True"
+        assert str(x == "foo") == "False"
+        assert str(x > 2**199) == "True"
+
+        with pytest.raises(SecretBoolException):
+            if x == 2**200:
+                pass
+
+    def test_secrecy(self):
+        with pytest.raises(SecretException):
+            print(SecretU64(42))
+        with pytest.raises(TypeError):
+            SecretU64(1) + SecretU256(1)
+
+    def test_out_of_range(self):
+        with pytest.raises(OverflowError):
+            SecretU64(2**70)
+        with pytest.raises(OverflowError):
+            SecretU64(-1)
+        with pytest.raises(OverflowError):
+            SecretI64(2**63)
+        assert reveal(SecretI64(-(2**63))) == -(2**63)
+        assert reveal(SecretU64(2**64 - 1)) == 2**64 - 1
+
+    def test_other_secrets_are_rejected(self):
+        with pytest.raises(TypeError):
+            SecretU64(5) + Secret.wrap(5)
+        with pytest.raises(TypeError):
+            SecretU64(5) < Secret.wrap(5)
+        assert str(SecretU64(5) == Secret.wrap(5)) == "False"
+
+    def test_mixed_types_are_rejected(self):
+        for other in [SecretI64(-1), SecretU256(1)]:
+            with pytest.raises(TypeError):
+                SecretU64(5) + other
+            with pytest.raises(TypeError):
+                SecretU64(5) < other
+            with pytest.raises(TypeError):
+                other < SecretU64(5)
@@ -0,0 +1,81 @@
+import pytest
+
+from secret_type import Secret
+from secret_type.containers import SecretPaddedStr
+from secret_type.index import SecretIndex, SecretKeyedDict
+
+
+class TestSecretKeyedDict:
+    @pytest.fixture
+    def table(self) -> SecretKeyedDict:
+        return SecretKeyedDict(
+            (Secret.wrap(k), user) for k, user in [("k1", "alice"), ("k2", "bob")]
+        )
+
+    def test_lookup(self, table: SecretKeyedDict):
+        assert table[Secret.wrap("k1")] == "alice"
+        assert table["k2"] == "bob"
+        assert table.get(Secret.wrap("k3")) is None
+        assert Secret.wrap("k1") in table
+        assert "k3" not in table
+        assert len(table) == 2
+
+    def test_lookup_returns_stored_key(self, table: SecretKeyedDict):
+        stored = table.lookup(Secret.wrap("k1"))
+        assert stored is not None and stored in list(table)
+        assert table.lookup("k3") is None
+
+    def test_types_must_match(self):
+        table = SecretKeyedDict([(Secret.wrap("1"), "str")])
+        assert Secret.wrap(b"1") not in table
+        assert Secret.wrap(1) not in table
+        table[Secret.wrap(1)] = "int"
+        assert table[1] == "int" and table["1"] == "str"
+
+    def test_other_containers(self):
+        table = SecretKeyedDict([(SecretPaddedStr("k1"), "alice")])
+        assert table["k1"] == "alice"
+
+    def test_set_and_delete(self, table: SecretKeyedDict):
+        table[Secret.wrap("k1")] = "carol"
+        assert table["k1"] == "carol" and len(table) == 2
+        del table[Secret.wrap("k1")]
+        assert "k1" not in table and len(table) == 1
+        with pytest.raises(KeyError):
+            del table["k1"]
+
+    def test_lookup_decrypts_once(self, table: SecretKeyedDict, monkeypatch):
+        probe = Secret.wrap("k2")
+        calls = []
+        decrypt = Secret._decrypt
+        monkeypatch.setattr(
+            Secret, "_decrypt", lambda self: calls.append(self) or decrypt(self)
+        )
+        assert table[probe] == "bob"
+        assert calls == [probe]
+
+    def test_rekey(self, table: SecretKeyedDict):
+        table.rekey(b"k" * 32)
+        assert table._key == b"k" * 32
+        assert table["k1"] == "alice" and table["k2"] == "bob"
+        assert len(table) == 2
+
+    def test_repr_hides_keys(self, table: SecretKeyedDict):
+        assert "k1" not in repr(table)
+
+
+class TestSecretIndex:
+    def test_membership(self):
+        index = SecretIndex(Secret.wrap(t) for t in ["a", "b"])
+        assert "a" in index and Secret.wrap("b") in index and "c" not in index
+
+        index.add(Secret.wrap("a"))
+        assert len(index) == 2
+        index.discard("a")
+        index.discard("a")
+        assert "a" not in index
+        with pytest.raises(KeyError):
+            index.remove("a")
+
+        index.rekey()
+        assert index.lookup("b") is not None
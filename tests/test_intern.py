@@ -0,0 +1,92 @@
+import gc
+
+import pytest
+
+from secret_type import Secret, intern
+from secret_type.containers import SecretPaddedStr, SecretStr
+from secret_type.exceptions import SecretInternException, SecretQuotaException
+from tests import reveal
+
+
+class TestIntern:
+    @pytest.fixture(autouse=True)
+    def table(self):
+        intern.clear()
+        yield
+        intern.disable()
+        intern.clear()
+
+    def test_intern_shares_equal_values(self):
+        a = Secret.intern("hunter2")
+        assert isinstance(a, SecretStr)
+        assert Secret.intern("hunter2") is a
+        assert Secret.intern(Secret.wrap("hunter2")) is a
+        assert Secret.intern("hunter3") is not a
+        assert reveal(a) == "hunter2"
+
+    def test_types_must_match(self):
+        a = Secret.intern("1")
+        assert Secret.intern(b"1") is not a
+        assert Secret.intern(1) is not a
+        assert SecretPaddedStr.intern("1") is not a
+        assert isinstance(SecretPaddedStr.intern("1"), SecretPaddedStr)
+
+    def test_size_classes_must_match(self):
+        large = SecretPaddedStr.intern(SecretPaddedStr("abc", size=256))
+        small = SecretPaddedStr.intern(SecretPaddedStr("abc", size=32))
+        assert small is not large
+        assert (large.size, small.size) == (256, 32)
+        assert SecretPaddedStr.intern("abc") is small
+        assert SecretPaddedStr.intern(SecretPaddedStr("abc", size=256)) is large
+
+    def test_interns_secrets(self):
+        s = Secret.wrap(42)
+        assert Secret.intern(s) is s
+        assert Secret.intern(42) is s
+
+    def test_weak_references(self):
+        a = Secret.intern("hunter2")
+        assert len(intern._table) == 1
+        del a
+        gc.collect()
+        assert len(intern._table) == 0
+
+    def test_automatic_interning(self):
+        assert Secret.wrap("hunter2") is not Secret.wrap("hunter2")
+        with intern.interning():
+            a = Secret.wrap("hunter2")
+            assert Secret.wrap("hunter2") is a
+            assert a.cast(bytes) is a.cast(bytes)
+            assert (a + "!") is Secret.wrap("hunter2!")
+        assert Secret.wrap("hunter2") is not a
+
+    def test_hit_skips_encryption(self, monkeypatch):
+        a = Secret.intern("hunter2")
+        monkeypatch.setattr("cryptography.fernet.Fernet.encrypt", None)
+        assert Secret.intern("hunter2") is a
+
+    def test_interned_settings_are_refused(self):
+        a = Secret.intern("hunter2")
+        for mutate in [
+            lambda: a.limited(1),
+            lambda: a.labeled("password"),
+            lambda: a.cached(),
+            lambda: a.uncached(),
+        ]:
+            with pytest.raises(SecretInternException):
+                mutate()
+        assert a._quotas == () and a._cache is None and a._provenance is None
+
+    def test_private_secrets_are_not_interned(self):
+        limited = Secret.wrap("hunter2").limited(1)
+        with pytest.raises(SecretInternException):
+            Secret.intern(limited)
+
+        with intern.interning():
+            shared = Secret.wrap("HUNTER2")
+            derived = limited.upper()
+            assert derived is not shared
+            assert reveal(derived) == "HUNTER2"
+            with pytest.raises(SecretQuotaException):
+                reveal(derived)
+            assert reveal(shared) == reveal(shared) == "HUNTER2"
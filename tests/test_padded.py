@@ -0,0 +1,125 @@
+import pytest
+
+from secret_type import Secret
+from secret_type.containers import SecretPaddedStr, SecretSlab, SecretStr
+from secret_type.exceptions import SecretException
+from tests import reveal
+
+
+class TestSecretPaddedStr:
+    def test_size_classes(self):
+        short, long = SecretPaddedStr("a"), SecretPaddedStr("a" * 27)
+        assert short.size == long.size == 32
+        assert len(short._sealed()[1]) == len(long._sealed()[1])
+        assert SecretPaddedStr(b"a" * 28).size == 64
+        assert SecretPaddedStr("a", size=128).size == 128
+
+        class Tokens(SecretPaddedStr):
+            SIZE_CLASSES = (16, 48)
+
+        assert Tokens("a" * 11).size == 16
+        assert Tokens("a" * 12).size == 48
+        with pytest.raises(ValueError):
+            Tokens("a" * 44)
+
+    def test_secrecy(self):
+        s = Secret.wrap("hunter2").padded()
+        assert isinstance(s, SecretPaddedStr)
+        assert reveal(s) == "hunter2"
+        assert reveal(s.upper()) == "HUNTER2"
+        assert reveal(SecretPaddedStr(b"\x00\x01")) == b"\x00\x01"
+        with pytest.raises(SecretException):
+            print(s)
+
+    def test_compare(self):
+        s = SecretPaddedStr("hunter2")
+        assert str(s == "hunter2") == "True"
+        assert str(s == SecretPaddedStr("hunter2", size=256)) == "True"
+        assert str(s == Secret.wrap("hunter2")) == "True"
+        assert str(s == "hunter") == "False"
+        assert str(s == b"hunter2") == "False"
+        assert str(s == 42) == "False"
+        assert str(s != "hunter3") == "True"
+
+    def test_concat(self):
+        s = SecretPaddedStr("foo") + "bar"
+        assert isinstance(s, SecretPaddedStr)
+        assert reveal(s) == "foobar"
+        assert s.size == 64
+        assert reveal("<" + SecretPaddedStr("foo") + SecretPaddedStr(">")) == "<foo>"
+        with pytest.raises(TypeError):
+            SecretPaddedStr("foo") + b"bar"
+
+    def test_derived_stay_padded(self):
+        s = SecretPaddedStr("hi")
+        token_size = len(s._sealed()[1])
+        for derived in [
+            s.upper(),
+            s[0:2],
+            s.cast(bytes),
+            s.dangerous_map(lambda x: x * 3),
+        ]:
+            assert isinstance(derived, SecretPaddedStr)
+            assert derived.size == 32
+            assert len(derived._sealed()[1]) == token_size
+        assert reveal(s.cast(bytes)) == b"hi"
+        assert reveal(s[0:1]) == "h"
+
+        # Results never shrink below the size class they came from
+        assert SecretPaddedStr("hi", size=128).upper().size == 128
+        assert s.dangerous_map(lambda x: x * 20).size == 64
+
+    def test_size_is_public(self, monkeypatch):
+        s = SecretPaddedStr("hunter2", size=256)
+        monkeypatch.setattr("cryptography.fernet.Fernet.decrypt", None)
+        assert s.size == 256
+
+    def test_size_must_be_block_aligned(self):
+        with pytest.raises(ValueError):
+            SecretPaddedStr("a", size=100)
+
+    def test_digest(self):
+        a, b = SecretPaddedStr(b"foo"), SecretPaddedStr(b"foo")
+        assert isinstance(a.digest(), SecretStr)
+        assert str(a.digest() == b.digest()) == "True"
+
+
+class TestSecretSlab:
+    def test_slab(self):
+        slab = SecretSlab(size=64, capacity=2)
+        nbytes = slab.nbytes
+
+        a = slab.store(SecretPaddedStr("foo", size=64))
+        b = slab.store(SecretPaddedStr("bar", size=64))
+        assert len(slab) == 2
+        assert reveal(slab.load(a)) == "foo"
+        assert reveal(slab.load(b)) == "bar"
+        with pytest.raises(IndexError):
+            slab.store(SecretPaddedStr("baz", size=64))
+        with pytest.raises(ValueError):
+            slab.store(SecretPaddedStr("baz", size=128))
+        with pytest.raises(ValueError):
+            # Same ciphertext length, but not a padded secret
+            slab.store(SecretStr("x" * 50))
+
+        slab.free(a)
+        assert reveal(slab.load(slab.store(SecretPaddedStr("baz", size=64)))) == "baz"
+        assert slab.nbytes == nbytes
+
+    def test_invalid_free(self):
+        slab = SecretSlab(size=32, capacity=2)
+        a = slab.store(SecretPaddedStr("foo"))
+        slab.free(a)
+        with pytest.raises(ValueError):
+            slab.free(a)
+        with pytest.raises(ValueError):
+            slab.load(a)
+        with pytest.raises(IndexError):
+            slab.free(2)
+
+        with pytest.raises(ValueError):
+            slab.store(SecretPaddedStr("foo").limited(0))
+
+        a, b = slab.store(SecretPaddedStr("foo")), slab.store(SecretPaddedStr("bar"))
+        assert a != b and len(slab) == 2
+        assert reveal(slab.load(a)) == "foo" and reveal(slab.load(b)) == "bar"
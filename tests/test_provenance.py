@@ -0,0 +1,102 @@
+import threading
+
+import pytest
+
+from secret_type import Secret, provenance
+
+
+class TestProvenance:
+    @pytest.fixture(autouse=True)
+    def tracking(self):
+        with provenance.tracking():
+            yield
+        provenance.reset()
+
+    def test_untracked(self):
+        s = Secret.wrap("foo") + "bar"
+        assert provenance.origin(s) is None
+        assert provenance.roots(s) == []
+
+    def test_derivations(self):
+        password = Secret.wrap("hunter2").labeled("password")
+        pepper = Secret.wrap("pepper").labeled("pepper")
+
+        derived = (password.upper() + pepper).cast(bytes)
+        assert provenance.origin(derived) == "cast"
+        assert provenance.roots(derived) == ["password", "pepper"]
+
+        number = (Secret.wrap(40).labeled("answer") + 2) * 1
+        assert provenance.lineage(number) == (
+            "mul",
+            (("add", (("answer", ()),)),),
+        )
+
+    def test_disabled(self):
+        password = Secret.wrap("hunter2").labeled("password")
+        provenance.disable()
+        assert provenance.origin(password + "!") is None
+
+    def test_reset(self):
+        password = Secret.wrap("hunter2").labeled("password")
+        provenance.reset()
+        assert provenance.origin(password) is None
+        assert provenance.origin(Secret.wrap(1).labeled("one")) == "one"
+
+    def test_reclaims_destroyed_secrets(self, monkeypatch):
+        monkeypatch.setattr(provenance, "_COMPACT_MIN", 8)
+        password = Secret.wrap("hunter2").labeled("password")
+        kept = password + "!"
+        for _ in range(50):
+            password.upper()
+        Secret.wrap(1).labeled("one")
+        assert len(provenance._origins) < 20
+
+        assert provenance.lineage(kept) == ("add", (("password", ()),))
+        assert provenance.origin(password.upper()) == "upper"
+
+    def test_keeps_history_of_live_secrets(self, monkeypatch):
+        monkeypatch.setattr(provenance, "_COMPACT_MIN", 1)
+        s = Secret.wrap("a").labeled("root")
+        for _ in range(10):
+            s = s + "a"
+        provenance.label(Secret.wrap(1), "compact")
+        assert provenance.roots(s) == ["root"]
+
+    def test_deep_lineage(self):
+        class Node:
+            _provenance = None
+
+        nodes = [Node()]
+        provenance.label(nodes[0], "root")
+        for _ in range(5000):
+            nodes.append(Node())
+            provenance.record(nodes[-1], "add", nodes[-2])
+
+        lineage = provenance.lineage(nodes[-1])
+        depth = 0
+        while lineage.parents:
+            (lineage,) = lineage.parents
+            depth += 1
+        assert depth == 5000 and lineage.label == "root"
+
+    def test_queries_wait_for_compaction(self):
+        s = Secret.wrap("hunter2").labeled("password")
+        results = {}
+        readers = [
+            threading.Thread(target=lambda q=query: results.setdefault(q, q(s)))
+            for query in (provenance.origin, provenance.roots, provenance.lineage)
+        ]
+
+        # A compaction holds the lock while it renumbers the table
+        with provenance._lock:
+            for reader in readers:
+                reader.start()
+                reader.join(0.05)
+                assert reader.is_alive()
+        for reader in readers:
+            reader.join()
+        assert results == {
+            provenance.origin: "password",
+            provenance.roots: ["password"],
+            provenance.lineage: ("password", ()),
+        }
@@ -0,0 +1,153 @@
+from dataclasses import dataclass
+from typing import ClassVar
+
+import pytest
+from cryptography.fernet import Fernet
+from typing_extensions import TypedDict
+
+from secret_type import Secret, intern, serialization
+from secret_type.containers import SecretRecord, SecretStr
+from secret_type.exceptions import SecretQuotaException
+from tests import reveal
+
+
+class Credentials(SecretRecord):
+    username: str
+    password: str
+    host: str
+    port: int = 5432
+    SCHEME: ClassVar[str] = "postgres"
+
+
+class TestSecretRecord:
+    @pytest.fixture
+    def creds(self) -> Credentials:
+        return Credentials("app", "hunter2", host="db.internal")
+
+    def test_fields(self, creds: Credentials):
+        assert Credentials.FIELDS == ("username", "password", "host", "port")
+        assert Credentials.SCHEME == "postgres"
+        c = reveal(creds)
+        assert c == ("app", "hunter2", "db.internal", 5432)
+        assert c.password == "hunter2" and c.port == 5432
+        assert isinstance(c, Credentials.TUPLE)
+
+    def test_invalid_fields(self):
+        with pytest.raises(TypeError):
+            Credentials("app")
+        with pytest.raises(TypeError):
+
+            class Invalid(SecretRecord):
+                a: int = 1
+                b: int
+
+    def test_inheritance(self):
+        class Extended(Credentials):
+            database: str = "app"
+
+        assert Extended.FIELDS[-1] == "database"
+        assert reveal(Extended("a", "b", "c")).port == 5432
+
+    def test_one_decrypt(self, creds: Credentials, monkeypatch):
+        calls = []
+        decrypt = Secret._decrypt
+        monkeypatch.setattr(
+            Secret, "_decrypt", lambda self: calls.append(self) or decrypt(self)
+        )
+        reveal(creds)
+        assert calls == [creds]
+
+    def test_field_access(self, creds: Credentials):
+        password = creds.get("password")
+        assert isinstance(password, SecretStr)
+        assert reveal(password) == "hunter2"
+        assert reveal(creds.dangerous_map_field("port", lambda p: p + 1)) == 5433
+
+        seen = []
+        creds.dangerous_apply_field("host", seen.append)
+        assert seen == ["db.internal"]
+
+        with pytest.raises(AttributeError):
+            creds.get("token")
+
+    def test_field_access_is_audited(self, creds: Credentials):
+        creds.limited(1)
+        creds.get("password")
+        creds.dangerous_apply_field("host", lambda _: None)
+        with pytest.raises(SecretQuotaException):
+            creds.dangerous_map_field("port", lambda p: p)
+
+    def test_replace(self, creds: Credentials):
+        updated = creds.replace(password=Secret.wrap("hunter3"), port=6543)
+        assert isinstance(updated, Credentials)
+        assert reveal(updated) == ("app", "hunter3", "db.internal", 6543)
+        assert reveal(creds).password == "hunter2"
+        with pytest.raises(ValueError):
+            creds.replace(token="x")
+
+    def test_replace_inherits_quotas(self, creds: Credentials):
+        updated = creds.replace(password=Secret.wrap("x").limited(0))
+        with pytest.raises(SecretQuotaException):
+            updated.dangerous_map_field("password", len)
+
+    def test_eq(self, creds: Credentials):
+        assert str(creds == Credentials("app", "hunter2", "db.internal")) == "True"
+        assert str(creds == creds.replace(port=1)) == "False"
+        assert str(creds == ("app", "hunter2", "db.internal", 5432)) == "True"
+        assert str(creds == ("app", "hunter2", "db.internal", "5432")) == "False"
+        assert str(creds == "app") == "False"
+
+    def test_of_dataclass(self):
+        @dataclass
+        class Token:
+            issuer: str
+            value: str = ""
+
+        SecretToken = SecretRecord.of(Token)
+        assert SecretToken.FIELDS == ("issuer", "value")
+        assert reveal(SecretToken("me")) == ("me", "")
+
+    def test_of_typed_dict(self):
+        class Token(TypedDict):
+            issuer: str
+            value: str
+
+        SecretToken = SecretRecord.of(Token)
+        assert SecretToken.FIELDS == ("issuer", "value")
+        assert reveal(SecretToken(issuer="me", value="x")).value == "x"
+
+        with pytest.raises(TypeError):
+            SecretRecord.of(int)
+
+    def test_of_partial_typed_dict(self):
+        class Token(TypedDict, total=False):
+            issuer: str
+            value: str
+
+        SecretToken = SecretRecord.of(Token)
+        with pytest.raises(TypeError):
+            SecretToken(issuer="me")
+        assert reveal(SecretToken("me", "x").get("value")) == "x"
+
+    def test_intern(self, creds: Credentials):
+        try:
+            a = Credentials.intern(("app", "hunter2", "db.internal"))
+            assert isinstance(a, Credentials)
+            assert reveal(a) == reveal(creds)
+            assert Credentials.intern(("app", "hunter2", "db.internal", 5432)) is a
+            assert Credentials.intern(Credentials("app", "hunter2", "db.internal")) is a
+        finally:
+            intern.clear()
+
+    def test_serialization(self, creds: Credentials, monkeypatch):
+        kek = Fernet(Fernet.generate_key())
+        with pytest.raises(TypeError):
+            serialization.dumps([creds], kek)
+
+        monkeypatch.setattr(serialization, "_TAGS", dict(serialization._TAGS))
+        monkeypatch.setattr(serialization, "_TYPES", dict(serialization._TYPES))
+        serialization.register(Credentials, 64)
+        (loaded,) = serialization.loads(serialization.dumps([creds], kek), kek)
+        assert type(loaded) is Credentials
+        assert reveal(loaded).password == "hunter2"
+        assert reveal(loaded.get("port")) == 5432
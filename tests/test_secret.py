@@ -1,6 +1,7 @@
 import hashlib
 import math
 import os
+import string
 
 import pytest
 from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
@@ -8,6 +9,7 @@ from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
 import secret_type
 from secret_type import Secret
 from secret_type.containers.number import SecretNumber
+from secret_type.containers.sequence import SecretTokens
 from secret_type.exceptions import SecretBoolException, SecretException
 
 
@@ -116,3 +118,63 @@ class TestSecret:
 
         with token.dangerous_reveal() as revealed:
             assert len(revealed) == 32
+
+    def test_token_odd_length(self):
+        with Secret.token(31).dangerous_reveal() as revealed:
+            assert len(revealed) == 31
+            int(revealed, 16)
+
+    def test_token_default_length(self):
+        for token in [Secret.token(), Secret.token(0)]:
+            with token.dangerous_reveal() as revealed:
+                assert len(revealed) == 64
+
+    def test_tokens_invalid(self):
+        assert Secret.tokens(0) == []
+        assert len(Secret.tokens(0, batched=True)) == 0
+        with pytest.raises(ValueError):
+            Secret.tokens(-1)
+        with pytest.raises(ValueError):
+            Secret.tokens(3, 0)
+        with pytest.raises(ValueError):
+            Secret.tokens(3, 8, alphabet="base32")
+
+    @pytest.mark.parametrize(
+        "alphabet,length,chars",
+        [
+            ("hex", 33, set("0123456789abcdef")),
+            ("urlsafe", 21, set(string.ascii_letters + string.digits + "-_")),
+            ("bytes", 17, None),
+        ],
+    )
+    def test_tokens(self, alphabet: str, length: int, chars: set):
+        tokens = Secret.tokens(5, length, alphabet=alphabet)
+        values = [t._dangerous_extract() for t in tokens]
+
+        assert len(set(values)) == 5
+        for value in values:
+            assert len(value) == length
+            if chars is None:
+                assert isinstance(value, bytes)
+            else:
+                assert set(value) <= chars
+
+    def test_tokens_batched(self):
+        batch = Secret.tokens(4, 16, alphabet="urlsafe", batched=True)
+        assert len(batch) == 4
+
+        with pytest.raises(SecretException):
+            print(batch[0])
+
+        with batch.dangerous_reveal() as revealed:
+            assert [t._dangerous_extract() for t in batch] == list(revealed)
+            assert revealed[2] == batch[2]._dangerous_extract()
+            assert all(len(t) == 16 for t in revealed)
+
+    def test_tokens_batched_slice(self):
+        batch = Secret.tokens(4, 8, batched=True)
+        head = batch[0:2]
+        assert isinstance(head, SecretTokens)
+        assert len(head) == 2
+        assert head._dangerous_extract() == batch._dangerous_extract()[:2]
+        assert len(batch[::-1]) == 4
@@ -0,0 +1,110 @@
+import io
+
+import pytest
+from cryptography.fernet import Fernet
+
+from secret_type import Secret, provenance, serialization
+from secret_type.containers import (
+    SecretBool,
+    SecretFixedInt,
+    SecretNumber,
+    SecretStr,
+    SecretTokens,
+    SecretU64,
+)
+from secret_type.exceptions import SecretException, SecretSerializationException
+from secret_type.serialization import dump, dumps, load, loads, register
+
+
+class TestSerialization:
+    @pytest.fixture
+    def kek(self) -> Fernet:
+        return Fernet(Fernet.generate_key())
+
+    def test_roundtrip(self, kek: Fernet):
+        values = ["foo", b"bar", 42, True, 1.5j]
+        data = dumps((Secret.wrap(v) for v in values), kek)
+
+        assert b"foo" not in data
+        loaded = loads(data, kek)
+        assert [type(s) for s in loaded] == [
+            SecretStr,
+            SecretStr,
+            SecretNumber,
+            SecretBool,
+            Secret,
+        ]
+        for s, v in zip(loaded, values):
+            with s.dangerous_reveal() as revealed:
+                assert revealed == v
+
+        with pytest.raises(SecretException):
+            print(loaded[0])
+
+    def test_streaming(self, kek: Fernet):
+        buf = io.BytesIO()
+        assert dump((Secret.wrap(i) for i in range(100)), buf, kek) == 100
+
+        buf.seek(0)
+        total = sum(s._dangerous_extract() for s in load(buf, kek))
+        assert total == sum(range(100))
+
+    def test_fixed_width(self, kek: Fernet):
+        (loaded,) = loads(dumps([SecretU64(2**64 - 1)], kek), kek)
+        assert isinstance(loaded, SecretU64)
+        with (loaded + 1).dangerous_reveal() as revealed:
+            assert revealed == 0
+
+    def test_tokens(self, kek: Fernet):
+        batch = Secret.tokens(3, 16, batched=True)
+        (loaded,) = loads(dumps([batch], kek), kek)
+        assert type(loaded) is SecretTokens
+        assert len(loaded) == 3
+        assert [t._dangerous_extract() for t in loaded] == list(
+            batch._dangerous_extract()
+        )
+
+    def test_private_state(self, kek: Fernet):
+        with pytest.raises(ValueError):
+            dumps([Secret.wrap("foo").limited(0)], kek)
+        with pytest.raises(ValueError):
+            dumps([Secret.wrap("foo").labeled("foo")], kek)
+        provenance.reset()
+
+    def test_wrong_kek(self, kek: Fernet):
+        data = dumps([Secret.wrap("foo")], kek)
+
+        with pytest.raises(SecretSerializationException):
+            loads(data, Fernet.generate_key())
+
+    def test_malformed(self, kek: Fernet):
+        data = dumps([Secret.wrap("foo")], kek)
+
+        with pytest.raises(SecretSerializationException):
+            loads(b"JUNK" + data[4:], kek)
+        with pytest.raises(SecretSerializationException):
+            loads(data[:-1], kek)
+
+    def test_unregistered_subclass(self, kek: Fernet):
+        class U128(SecretFixedInt):
+            BITS = 128
+
+        with pytest.raises(TypeError):
+            dumps([U128(1)], kek)
+
+    def test_register(self, kek: Fernet, monkeypatch):
+        class U128(SecretFixedInt):
+            BITS = 128
+
+        monkeypatch.setattr(serialization, "_TAGS", dict(serialization._TAGS))
+        monkeypatch.setattr(serialization, "_TYPES", dict(serialization._TYPES))
+        with pytest.raises(ValueError):
+            register(U128, 1)
+        register(U128, 64)
+        with pytest.raises(ValueError):
+            register(SecretU64, 64)
+
+        (loaded,) = loads(dumps([U128(2**100)], kek), kek)
+        assert type(loaded) is U128
+        with loaded.dangerous_reveal() as revealed:
+            assert revealed == 2**100